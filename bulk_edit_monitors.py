@@ -5,8 +5,27 @@ This script allows you to list all monitors, select specific ones by UUID, and u
 Supports VALIDATION, CUSTOM_SQL, METRIC, STATS, and COMPARISON monitor types.
 """
 
+import atexit
 import json
+import logging
+import queue
 import argparse
+from logging.handlers import QueueHandler, QueueListener
+
+# Set up logging for the whole application here, so library modules can
+# stay handler-free. Records go through a queue drained by a background
+# listener thread, keeping stream I/O off the worker threads doing the
+# actual API calls
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter(
+    fmt='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+))
+_listener = QueueListener(_log_queue, _stream_handler)
+_listener.start()
+atexit.register(_listener.stop)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
 
 # Import from our modular components
 from mc_client import MonteCarloClient
@@ -30,6 +49,8 @@ def main():
     parser.add_argument('--update-type', choices=['schedule', 'description', 'alerts', 'interactive'], 
                        default='interactive', help='Type of update to perform')
     parser.add_argument('--get-schema', action='store_true', help='Retrieve and print GraphQL schema')
+    parser.add_argument('--refresh-schema', action='store_true',
+                       help='Bypass the cached GraphQL schema and re-run introspection')
     parser.add_argument('--template-file', help='JSON file with update template')
     
     args = parser.parse_args()
@@ -50,7 +71,7 @@ def main():
         return
 
     if args.get_schema:
-        get_graphql_schema(mc_client)
+        get_graphql_schema(mc_client, use_cache=not args.refresh_schema)
         return
     
     # Select monitors to update
@@ -97,20 +118,26 @@ def main():
     elif args.update_type == 'alerts':
         update_fn = update_alert_thresholds_example
     elif args.update_type == 'interactive':
-        # In interactive mode, we'll create a template for each monitor type
-        # and ask the user to fill it in
+        # In interactive mode, templates (and the user's answers) depend
+        # only on the monitor type, so collect every answer up front -
+        # once per type in the selection - before the concurrent bulk
+        # update starts. The worker threads then only do dict lookups
+        # instead of blocking on (and interleaving) stdin prompts.
+        filled_updates_by_type = {}
+        if not template_updates:
+            selected_types = {m.get('monitorType', 'VALIDATION') for m in selected_monitors}
+            for monitor_type in sorted(selected_types):
+                template = create_update_template(monitor_type)
+                filled_updates_by_type[monitor_type] = fill_template_interactively(template)
+
         def interactive_update_fn(monitor):
-            # Create template based on monitor type
-            template = create_update_template(monitor.get('monitorType', 'VALIDATION'))
-            
             # If template updates were loaded from a file, use those
             if template_updates:
                 return apply_template_updates(monitor, template_updates)
-            
-            # Otherwise, fill the template interactively
-            updates = fill_template_interactively(template)
-            return apply_template_updates(monitor, updates)
-        
+
+            monitor_type = monitor.get('monitorType', 'VALIDATION')
+            return apply_template_updates(monitor, filled_updates_by_type[monitor_type])
+
         update_fn = interactive_update_fn
     else:
         print(f"Update type '{args.update_type}' not recognized. Exiting.")
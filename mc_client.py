@@ -6,8 +6,11 @@ This module provides a wrapper for the Monte Carlo API client and utilities.
 
 import os
 import sys
+import inspect
 import logging
 import configparser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 # Set up logging
 logging.basicConfig(
@@ -27,226 +30,392 @@ except ImportError:
     LOGGER.info("For more information, visit: https://pypi.org/project/gql/")
     sys.exit(1)
 
-class DictToObject:
-    """Helper class to convert dictionary to object with attribute access"""
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional - it provides a much faster C-level JSON encoder and
+# decoder for the large payloads returned by monitor list queries
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The JSON codec hooks only exist in gql 4.0+. gql 3.x silently accepts
+# unknown transport kwargs and forwards them to requests at execute time,
+# so the hooks must be gated on the actual constructor signature rather
+# than a construction-time TypeError
+_TRANSPORT_SUPPORTS_JSON_HOOKS = (
+    'json_deserialize' in inspect.signature(RequestsHTTPTransport.__init__).parameters
+)
+
+@lru_cache(maxsize=1)
+def _load_profiles():
+    """Read and parse the MCD profiles file once per process
+
+    Returns:
+        ConfigParser with the parsed profiles, or None if no config file exists
+    """
+    config_path = os.path.join(os.path.expanduser("~"), ".mcd", "profiles.ini")
+    if not os.path.exists(config_path):
+        return None
+
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config
+
+def _resolve_credentials(profile_name):
+    """Resolve credentials for a profile from the MCD config file
+
+    Args:
+        profile_name (str): Profile section name (e.g. "default")
+
+    Returns:
+        tuple: (mcd_id, mcd_token)
+
+    Raises:
+        ValueError: If the config file, profile or credentials are missing
+    """
+    config = _load_profiles()
+    if config is None:
+        raise ValueError("No profiles configuration file found")
+
+    if profile_name not in config:
+        if profile_name == "default":
+            raise ValueError("No default profile found in config file")
+        raise ValueError(f"Profile '{profile_name}' not found in config file")
+
+    mcd_id = config[profile_name].get("mcd_id")
+    mcd_token = config[profile_name].get("mcd_token")
+
+    if not (mcd_id and mcd_token):
+        if profile_name == "default":
+            raise ValueError("Default profile does not contain valid credentials")
+        raise ValueError(f"Profile '{profile_name}' does not contain valid credentials")
+
+    return mcd_id, mcd_token
+
+@lru_cache(maxsize=64)
+def _parse(query):
+    """Parse a GraphQL query string into a document, memoized per string
+
+    The query strings used by the monitor manager are a small fixed set of
+    literals, so repeated executions (e.g. bulk updates) hit the cache and
+    skip the GraphQL parser entirely.
+
+    Args:
+        query (str): GraphQL query string
+
+    Returns:
+        Parsed GraphQL document
+    """
+    return gql(query)
+
+class MonteCarloClient:
+    """Wrapper for Monte Carlo API client"""
     
-    def __init__(self, data):
-        """Initialize with data
-        
+    def __init__(self, profile=None, mcd_id=None, mcd_token=None, verify_ssl=True):
+        """Initialize Monte Carlo client
+
         Args:
-            data: Dictionary or other data to convert
+            profile (str, optional): Monte Carlo profile name
+            mcd_id (str, optional): Monte Carlo ID
+            mcd_token (str, optional): Monte Carlo token
+            verify_ssl (bool, optional): Whether to verify SSL certificates;
+                verification also allows TLS session resumption across calls
         """
-        if isinstance(data, dict):
-            for key, value in data.items():
-                # Convert camelCase to snake_case for attribute names
-                snake_key = self._camel_to_snake(key)
-                setattr(self, snake_key, self.__class__(value))
-            # Store original dict for direct access if needed
-            self._data = data
-        elif isinstance(data, list):
-            self._data = []
-            for item in data:
-                self._data.append(self.__class__(item))
-            # Make the object itself iterable if it's a list
-            self.__iter__ = lambda: iter(self._data)
-            self.__getitem__ = lambda i: self._data[i]
-            self.__len__ = lambda: len(self._data)
-        else:
-            self._data = data
+        try:
+            # Determine the authentication parameters
+            if mcd_id and mcd_token:
+                # Use provided credentials
+                session_type = "direct"
+            elif profile:
+                # Get credentials from profile
+                mcd_id, mcd_token = _resolve_credentials(profile)
+                session_type = f"profile '{profile}'"
+            else:
+                # Try to use default profile
+                mcd_id, mcd_token = _resolve_credentials("default")
+                session_type = "default profile"
+
+            auth_headers = {
+                "X-MCD-ID": mcd_id,
+                "X-MCD-TOKEN": mcd_token
+            }
+
+            # Set up the transport
+            transport_kwargs = {
+                "url": "https://api.getmontecarlo.com/graphql",
+                "headers": auth_headers,
+                "verify": verify_ssl,
+                "retries": 3
+            }
+
+            # Use orjson for request/response JSON when the transport
+            # actually supports the hooks; older gql falls back to the
+            # stdlib codec
+            if orjson is not None and _TRANSPORT_SUPPORTS_JSON_HOOKS:
+                transport_kwargs["json_serialize"] = lambda obj: orjson.dumps(obj).decode()
+                transport_kwargs["json_deserialize"] = orjson.loads
+
+            transport = RequestsHTTPTransport(**transport_kwargs)
+
+            if not verify_ssl:
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                LOGGER.warning("SSL certificate verification is disabled")
+            
+            # Create the GQL client
+            self.client = GQLClient(transport=transport)
+
+            # Hold a persistent session so the underlying requests.Session
+            # (and its TCP/TLS connection) is reused across queries instead
+            # of reconnecting per call
+            try:
+                self.session = self.client.connect_sync()
+            except AttributeError:
+                # Older gql versions without persistent sync sessions
+                self.session = None
+
+            # The transport's requests.Session already keeps connections
+            # alive, but its default pool only holds a few sockets; size it
+            # for the thread pools used by execute_query_many and bulk
+            # updates so concurrent queries don't queue on the pool. The
+            # retry policy backs off on transient statuses (throttling and
+            # gateway errors) instead of retrying immediately;
+            # allowed_methods=None covers POST, which every GraphQL call
+            # uses and urllib3's default method list excludes
+            transport_session = getattr(transport, "session", None)
+            if transport_session is not None:
+                retry_policy = Retry(total=3, backoff_factor=0.3,
+                                     status_forcelist=[429, 502, 503, 504],
+                                     allowed_methods=None)
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                      max_retries=retry_policy)
+                transport_session.mount("https://", adapter)
+
+            LOGGER.info(f"Connected to Monte Carlo API using {session_type}")
+
+        except Exception as e:
+            LOGGER.error(f"Failed to initialize Monte Carlo client: {str(e)}")
+            sys.exit(1)
     
-    def __getattr__(self, name):
-        """Handle attribute access for non-existent attributes
+    def execute_query(self, query, variables=None):
+        """Execute a GraphQL query
         
         Args:
-            name: Attribute name
+            query (str): GraphQL query
+            variables (dict, optional): Query variables
             
         Returns:
-            None if attribute doesn't exist
+            dict: Query result as a plain dictionary keyed by field name
         """
-        return None
-    
-    def get(self, key, default=None):
-        """Dict-like get method
-        
+        try:
+            # Parse the GraphQL query (memoized per query string)
+            gql_query = _parse(query)
+
+            # Execute the query and return the raw result dictionary,
+            # reusing the persistent session when available
+            if self.session is not None:
+                return self.session.execute(gql_query, variable_values=variables)
+            return self.client.execute(gql_query, variable_values=variables)
+        except Exception as e:
+            LOGGER.error(f"Query execution failed: {str(e)}")
+            raise
+
+    def execute_ast(self, ast, variables=None):
+        """Execute a pre-parsed GraphQL document
+
+        Skips query-string parsing entirely, for documents parsed once at
+        import time (see the AST constants in monitor_manager).
+
         Args:
-            key: Key to get
-            default: Default value if key doesn't exist
-            
+            ast: Parsed GraphQL document (as returned by gql())
+            variables (dict, optional): Query variables
+
         Returns:
-            Value for key or default
+            dict: Query result as a plain dictionary keyed by field name
         """
-        if hasattr(self, key):
-            return getattr(self, key)
-        
-        # Try snake_case version of the key
-        snake_key = self._camel_to_snake(key)
-        if hasattr(self, snake_key):
-            return getattr(self, snake_key)
-        
-        return default
-    
-    def _camel_to_snake(self, name):
-        """Convert camelCase to snake_case
-        
+        try:
+            if self.session is not None:
+                return self.session.execute(ast, variable_values=variables)
+            return self.client.execute(ast, variable_values=variables)
+        except Exception as e:
+            LOGGER.error(f"Query execution failed: {str(e)}")
+            raise
+
+    def execute_query_many(self, queries_and_vars, max_workers=10):
+        """Execute multiple GraphQL queries concurrently
+
+        Queries are dispatched through a thread pool so that the total wall
+        time is bounded by the slowest request rather than the sum of all
+        round-trips. Failures are isolated per query: an exception for one
+        query is captured in its result slot instead of aborting the batch.
+
         Args:
-            name: Name to convert
-            
+            queries_and_vars (list): List of (query, variables) tuples
+            max_workers (int, optional): Maximum number of concurrent requests
+
         Returns:
-            snake_case version of name
+            list: Results in the same order as the input; entries are either
+                query results or the exception raised for that query
         """
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        results = [None] * len(queries_and_vars)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submit all queries and remember their position in the batch
+            future_to_index = {
+                executor.submit(self.execute_query, query, variables): index
+                for index, (query, variables) in enumerate(queries_and_vars)
+            }
+
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                exception = future.exception()
+                if exception is not None:
+                    LOGGER.error(f"Query {index} in batch failed: {str(exception)}")
+                    results[index] = exception
+                else:
+                    results[index] = future.result()
+
+        return results
+
+class AsyncMonteCarloClient:
+    """Async wrapper for the Monte Carlo API client
+
+    Mirrors MonteCarloClient but executes queries as coroutines over gql's
+    AIOHTTPTransport, so callers can keep hundreds of monitor updates in
+    flight on a single event loop with asyncio.gather.
+    """
+
+    def __init__(self, profile=None, mcd_id=None, mcd_token=None, verify_ssl=True):
+        """Initialize async Monte Carlo client
 
-class MonteCarloClient:
-    """Wrapper for Monte Carlo API client"""
-    
-    def __init__(self, profile=None, mcd_id=None, mcd_token=None):
-        """Initialize Monte Carlo client
-        
         Args:
             profile (str, optional): Monte Carlo profile name
             mcd_id (str, optional): Monte Carlo ID
             mcd_token (str, optional): Monte Carlo token
+            verify_ssl (bool, optional): Whether to verify SSL certificates
         """
+        try:
+            from gql.transport.aiohttp import AIOHTTPTransport
+        except ImportError:
+            LOGGER.error("The aiohttp transport is required but not installed.")
+            LOGGER.info("Install it using: pip install gql[aiohttp]")
+            sys.exit(1)
+
         try:
             # Determine the authentication parameters
             if mcd_id and mcd_token:
-                # Use provided credentials
-                auth_headers = {
-                    "X-MCD-ID": mcd_id,
-                    "X-MCD-TOKEN": mcd_token
-                }
                 session_type = "direct"
             elif profile:
-                # Get credentials from profile
-                config_path = os.path.join(os.path.expanduser("~"), ".mcd", "profiles.ini")
-                if os.path.exists(config_path):
-                    config = configparser.ConfigParser()
-                    config.read(config_path)
-                    
-                    if profile in config:
-                        mcd_id = config[profile].get("mcd_id")
-                        mcd_token = config[profile].get("mcd_token")
-                        
-                        if mcd_id and mcd_token:
-                            auth_headers = {
-                                "X-MCD-ID": mcd_id,
-                                "X-MCD-TOKEN": mcd_token
-                            }
-                            session_type = f"profile '{profile}'"
-                        else:
-                            raise ValueError(f"Profile '{profile}' does not contain valid credentials")
-                    else:
-                        raise ValueError(f"Profile '{profile}' not found in config file")
-                else:
-                    raise ValueError("No profiles configuration file found")
+                mcd_id, mcd_token = _resolve_credentials(profile)
+                session_type = f"profile '{profile}'"
             else:
-                # Try to use default profile
-                config_path = os.path.join(os.path.expanduser("~"), ".mcd", "profiles.ini")
-                if os.path.exists(config_path):
-                    config = configparser.ConfigParser()
-                    config.read(config_path)
-                    
-                    if "default" in config:
-                        mcd_id = config["default"].get("mcd_id")
-                        mcd_token = config["default"].get("mcd_token")
-                        
-                        if mcd_id and mcd_token:
-                            auth_headers = {
-                                "X-MCD-ID": mcd_id,
-                                "X-MCD-TOKEN": mcd_token
-                            }
-                            session_type = "default profile"
-                        else:
-                            raise ValueError("Default profile does not contain valid credentials")
-                    else:
-                        raise ValueError("No default profile found in config file")
-                else:
-                    raise ValueError("No profiles configuration file found")
-            
-            # Set up the transport with SSL verification disabled
-            transport = RequestsHTTPTransport(
+                mcd_id, mcd_token = _resolve_credentials("default")
+                session_type = "default profile"
+
+            auth_headers = {
+                "X-MCD-ID": mcd_id,
+                "X-MCD-TOKEN": mcd_token
+            }
+
+            transport = AIOHTTPTransport(
                 url="https://api.getmontecarlo.com/graphql",
                 headers=auth_headers,
-                verify=False,  # Disable SSL verification
-                retries=3
+                ssl=verify_ssl
             )
-            
-            # Create the GQL client
+
             self.client = GQLClient(transport=transport)
-            LOGGER.info(f"Connected to Monte Carlo API using {session_type}")
-            
-            # Add a warning about SSL verification being disabled
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            LOGGER.warning("SSL certificate verification is disabled")
-            
+            # Session is opened lazily on the running event loop
+            self.session = None
+
+            LOGGER.info(f"Connected to Monte Carlo API using {session_type} (async)")
+
         except Exception as e:
             LOGGER.error(f"Failed to initialize Monte Carlo client: {str(e)}")
             sys.exit(1)
-    
-    def execute_query(self, query, variables=None):
-        """Execute a GraphQL query
-        
+
+    async def _get_session(self):
+        """Get or open the persistent async session"""
+        if self.session is None:
+            self.session = await self.client.connect_async()
+        return self.session
+
+    async def execute_query(self, query, variables=None):
+        """Execute a GraphQL query asynchronously
+
         Args:
             query (str): GraphQL query
             variables (dict, optional): Query variables
-            
+
         Returns:
-            dict: Query result
+            dict: Query result as a plain dictionary keyed by field name
         """
         try:
-            # Parse the GraphQL query
-            gql_query = gql(query)
-            
-            # Execute the query
-            result = self.client.execute(gql_query, variable_values=variables)
-            
-            # Convert to an object similar to pycarlo's response format for compatibility
-            result_obj = DictToObject(result)
-            return result_obj
+            # Parse the GraphQL query (memoized per query string)
+            gql_query = _parse(query)
+
+            session = await self._get_session()
+            return await session.execute(gql_query, variable_values=variables)
         except Exception as e:
             LOGGER.error(f"Query execution failed: {str(e)}")
             raise
 
+    async def close(self):
+        """Close the underlying transport session"""
+        if self.session is not None:
+            await self.client.close_async()
+            self.session = None
+
 # Utility functions for deep conversion
 def deep_dict_convert(obj):
     """
-    Recursively convert DictToObject and other custom objects to plain dictionaries
-    
+    Recursively convert custom objects to plain dictionaries
+
     Args:
         obj: Object to convert
-        
+
     Returns:
         Plain dictionary or original object if not convertible
     """
-    if obj is None:
-        return None
-    
-    # Handle DictToObject
-    if hasattr(obj, '__dict__'):
-        return {k: deep_dict_convert(v) for k, v in obj.__dict__.items()}
-    
-    # Handle objects with to_dict method
-    if hasattr(obj, 'to_dict'):
-        return deep_dict_convert(obj.to_dict())
-    
-    # Handle dictionaries
+    # Primitives are the common case in GraphQL responses - pass them through
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+
+    # Handle dictionaries; if nothing inside needed converting, return the
+    # original dict unchanged instead of keeping a redundant copy
     if isinstance(obj, dict):
-        return {k: deep_dict_convert(v) for k, v in obj.items()}
-    
-    # Handle lists
+        changed = False
+        converted = {}
+        for key, value in obj.items():
+            converted_value = deep_dict_convert(value)
+            converted[key] = converted_value
+            if converted_value is not value:
+                changed = True
+        return converted if changed else obj
+
+    # Handle lists, with the same already-plain short-circuit
     if isinstance(obj, list):
-        return [deep_dict_convert(item) for item in obj]
-    
+        converted = [deep_dict_convert(item) for item in obj]
+        if all(converted_item is item for converted_item, item in zip(converted, obj)):
+            return obj
+        return converted
+
     # Handle sets
     if isinstance(obj, set):
         return {deep_dict_convert(item) for item in obj}
-    
+
     # Handle tuples
     if isinstance(obj, tuple):
         return tuple(deep_dict_convert(item) for item in obj)
-    
-    # Return primitive types as is
+
+    # Handle objects with attribute-based data
+    if hasattr(obj, '__dict__'):
+        return {k: deep_dict_convert(v) for k, v in obj.__dict__.items()}
+
+    # Handle objects with to_dict method
+    if hasattr(obj, 'to_dict'):
+        return deep_dict_convert(obj.to_dict())
+
+    # Return anything else as is
     return obj
\ No newline at end of file
@@ -6,6 +6,8 @@ This module provides a wrapper for managing Monte Carlo monitors via the GraphQL
 
 import logging
 
+from gql import gql
+
 from mc_client import deep_dict_convert
 
 # Set up logging
@@ -16,6 +18,180 @@ logging.basicConfig(
 )
 LOGGER = logging.getLogger()
 
+# Maximum number of aliased mutations to combine into a single GraphQL
+# document, to stay under the server's per-query complexity limit
+MAX_MUTATION_BATCH = 25
+
+# Minimal projection used for listing and selection; type-specific detail
+# queries fetch the remaining fields only for selected monitors
+DEFAULT_MONITOR_FIELDS = ["uuid", "monitorType", "name"]
+
+# Full projection for callers that need everything getMonitors exposes
+FULL_MONITOR_FIELDS = [
+    "uuid", "monitorType", "name", "description", "prevExecutionTime",
+    "dataQualityDimension", "alertIds", "createdTime", "consolidatedMonitorStatus"
+]
+
+# Query and mutation documents, hoisted to module level so repeated calls
+# reuse the same string objects (and hit the client-side parse cache)
+_GET_MONITORS_QUERY_TEMPLATE = """
+query getMonitors($alertedOnly: Boolean,
+                $consolidatedStatusTypes: [ConsolidatedMonitorStatusType],
+                $domainId: UUID,
+                $includeOotbMonitors: Boolean,
+                $labels: [String],
+                $limit: Int,
+                $mcons: [String],
+                $monitorTypes: [UserDefinedMonitors],
+                $tags: [TagKeyValuePairInput!],
+                $uuids: [String]) {{
+getMonitors(alertedOnly: $alertedOnly,
+            consolidatedStatusTypes: $consolidatedStatusTypes,
+            domainId: $domainId,
+            includeOotbMonitors: $includeOotbMonitors,
+            labels: $labels,
+            limit: $limit,
+            mcons: $mcons,
+            monitorTypes: $monitorTypes,
+            tags: $tags,
+            uuids: $uuids) {{
+    {selection}
+}}
+}}
+"""
+
+_GET_CUSTOM_RULE_QUERY = """
+query getCustomRule($ruleId: String!) {
+  getCustomRule(ruleId: $ruleId) {
+    intervalMinutes
+    comparisons {
+      comparisonType
+      metric
+      operator
+      threshold
+    }
+    description
+    timezone
+    startTime
+    customSql
+  }
+}
+"""
+
+_CREATE_OR_UPDATE_CUSTOM_SQL_RULE_MUTATION = """
+mutation createOrUpdateCustomSqlRule($input: CreateOrUpdateCustomSqlRuleInput!) {
+  createOrUpdateCustomSqlRule(input: $input) {
+    customRule {
+      uuid
+      creatorId
+      description
+    }
+  }
+}
+"""
+
+_CREATE_OR_UPDATE_METRIC_MONITOR_MUTATION = """
+mutation createOrUpdateMetricMonitor($input: CreateOrUpdateMetricMonitorInput!) {
+  createOrUpdateMetricMonitor(input: $input) {
+    metricMonitor {
+      uuid
+      name
+      description
+      createdBy {
+        email
+      }
+    }
+  }
+}
+"""
+
+_GET_JOB_EXECUTIONS_QUERY = """
+query getJobExecutions($customRuleUuid: String,
+                     $monitorUuid: String,
+                     $historyDays: Int,
+                     $cursor: String,
+                     $first: Int) {
+  getJobExecutions(customRuleUuid: $customRuleUuid,
+                 monitorUuid: $monitorUuid,
+                 historyDays: $historyDays,
+                 after: $cursor,
+                 first: $first) {
+    pageInfo {
+      endCursor
+      hasNextPage
+    }
+    edges {
+      node {
+        jobExecutionUuid
+        startTime
+        endTime
+        status
+        exceptions
+        exceptionsDetail {
+          type
+          description
+          sqlQuery
+        }
+      }
+    }
+  }
+}
+"""
+
+# Documents with fixed selection sets are parsed once at import time so the
+# hot paths skip string parsing entirely; getMonitors is parsed per selection
+# set through the client-side parse cache instead
+_GET_CUSTOM_RULE_AST = gql(_GET_CUSTOM_RULE_QUERY)
+_CREATE_OR_UPDATE_CUSTOM_SQL_RULE_AST = gql(_CREATE_OR_UPDATE_CUSTOM_SQL_RULE_MUTATION)
+_CREATE_OR_UPDATE_METRIC_MONITOR_AST = gql(_CREATE_OR_UPDATE_METRIC_MONITOR_MUTATION)
+_GET_JOB_EXECUTIONS_AST = gql(_GET_JOB_EXECUTIONS_QUERY)
+
+def _build_get_monitors_request(limit, monitor_types, mcons, uuids, labels, tags,
+                                domain_id, consolidated_status_types,
+                                include_ootb_monitors, alerted_only, fields):
+    """Build the getMonitors query document and variables
+
+    Shared between the sync and async monitor listing paths.
+
+    Returns:
+        tuple: (query string, variables dict)
+    """
+    # Build the selection set from the requested fields
+    selection = "\n    ".join(fields or DEFAULT_MONITOR_FIELDS)
+    query = _GET_MONITORS_QUERY_TEMPLATE.format(selection=selection)
+
+    # Prepare variables
+    variables = {"limit": limit}
+
+    if monitor_types:
+        variables["monitorTypes"] = monitor_types
+
+    if mcons:
+        variables["mcons"] = mcons
+
+    if uuids:
+        variables["uuids"] = uuids
+
+    if labels:
+        variables["labels"] = labels
+
+    if tags:
+        variables["tags"] = tags
+
+    if domain_id:
+        variables["domainId"] = domain_id
+
+    if consolidated_status_types:
+        variables["consolidatedStatusTypes"] = consolidated_status_types
+
+    if include_ootb_monitors is not None:
+        variables["includeOotbMonitors"] = include_ootb_monitors
+
+    if alerted_only is not None:
+        variables["alertedOnly"] = alerted_only
+
+    return query, variables
+
 class MonitorManager:
     """Class for managing Monte Carlo monitors"""
     
@@ -27,11 +203,11 @@ class MonitorManager:
         """
         self.mc_client = mc_client
     
-    def get_monitors(self, limit=100, monitor_types=None, mcons=None, uuids=None, 
+    def get_monitors(self, limit=100, monitor_types=None, mcons=None, uuids=None,
                     labels=None, tags=None, domain_id=None, consolidated_status_types=None,
-                    include_ootb_monitors=None, alerted_only=None):
+                    include_ootb_monitors=None, alerted_only=None, fields=None):
         """Get a list of monitors
-        
+
         Args:
             limit (int, optional): Maximum number of monitors to return
             monitor_types (list, optional): Types of monitors to return
@@ -43,124 +219,88 @@ class MonitorManager:
             consolidated_status_types (list, optional): Status types to filter by
             include_ootb_monitors (bool, optional): Whether to include out-of-the-box monitors
             alerted_only (bool, optional): Whether to only include monitors with alerts
-            
+            fields (list, optional): Fields to select per monitor; defaults to
+                the minimal DEFAULT_MONITOR_FIELDS projection to keep response
+                payloads small
+
         Returns:
             list: List of monitors
         """
-        # Prepare the query
-        query = """
-        query getMonitors($alertedOnly: Boolean,
-                        $consolidatedStatusTypes: [ConsolidatedMonitorStatusType],
-                        $domainId: UUID,
-                        $includeOotbMonitors: Boolean,
-                        $labels: [String],
-                        $limit: Int,
-                        $mcons: [String],
-                        $monitorTypes: [UserDefinedMonitors],
-                        $tags: [TagKeyValuePairInput!],
-                        $uuids: [String]) {
-        getMonitors(alertedOnly: $alertedOnly,
-                    consolidatedStatusTypes: $consolidatedStatusTypes,
-                    domainId: $domainId,
-                    includeOotbMonitors: $includeOotbMonitors,
-                    labels: $labels,
-                    limit: $limit,
-                    mcons: $mcons,
-                    monitorTypes: $monitorTypes,
-                    tags: $tags,
-                    uuids: $uuids) {
-            uuid
-            monitorType
-            name
-            description
-            prevExecutionTime
-            dataQualityDimension
-            alertIds
-            createdTime
-            consolidatedMonitorStatus
-        }
-        }
-        """
-        
-        # Prepare variables
-        variables = {"limit": limit}
-        
-        if monitor_types:
-            variables["monitorTypes"] = monitor_types
-        
-        if mcons:
-            variables["mcons"] = mcons
-        
-        if uuids:
-            variables["uuids"] = uuids
-        
-        if labels:
-            variables["labels"] = labels
-        
-        if tags:
-            variables["tags"] = tags
-        
-        if domain_id:
-            variables["domainId"] = domain_id
-        
-        if consolidated_status_types:
-            variables["consolidatedStatusTypes"] = consolidated_status_types
-        
-        if include_ootb_monitors is not None:
-            variables["includeOotbMonitors"] = include_ootb_monitors
-        
-        if alerted_only is not None:
-            variables["alertedOnly"] = alerted_only
-        
+        query, variables = _build_get_monitors_request(
+            limit, monitor_types, mcons, uuids, labels, tags, domain_id,
+            consolidated_status_types, include_ootb_monitors, alerted_only, fields)
+
         # Execute the query
         result = self.mc_client.execute_query(query, variables)
-        
+
         # Log the query and variables for debugging
         LOGGER.info(f"Query variables: {variables}")
-        
-        # Direct access to the returned data structure
-        monitors = []
-        
-        if hasattr(result, '_data'):
-            data = result._data
-            if isinstance(data, dict) and 'data' in data and 'getMonitors' in data['data']:
-                monitors_data = data['data']['getMonitors']
-                if monitors_data and isinstance(monitors_data, list):
-                    monitors = monitors_data
-        
-        # If we still don't have monitors, try other access methods
-        if not monitors:
-            if hasattr(result, 'data') and result.data:
-                if hasattr(result.data, 'get_monitors'):
-                    monitors_data = result.data.get_monitors
-                    if monitors_data and hasattr(monitors_data, '_data') and isinstance(monitors_data._data, list):
-                        monitors = monitors_data._data
-            
-            # One more approach - check for get_monitors attribute
-            if hasattr(result, 'get_monitors'):
-                monitors_data = result.get_monitors
-                if monitors_data and hasattr(monitors_data, '_data') and isinstance(monitors_data._data, list):
-                    monitors = monitors_data._data
-        
-        # Fallback to empty list if no data found
+
+        # The transport returns plain dicts, so the monitor list is usable as-is
+        monitors = result.get('getMonitors') if isinstance(result, dict) else None
+
         if not monitors:
             LOGGER.error("Failed to get monitors")
             return []
-        
-        # Process the monitors for consistent dictionary format
-        processed_monitors = []
-        for monitor in monitors:
-            # If monitor is already a dict, use it directly
-            if isinstance(monitor, dict):
-                processed_monitors.append(monitor)
-            # If monitor is a DictToObject, convert it to a dict
-            elif hasattr(monitor, '_data'):
-                processed_monitors.append(monitor._data)
-            # Otherwise, try to convert it to a dict
-            else:
-                processed_monitors.append(deep_dict_convert(monitor))
-        
-        return processed_monitors
+
+        return monitors
+
+    def iter_monitors(self, page_size=100, **filters):
+        """Iterate monitors lazily instead of materializing a full list
+
+        getMonitors does not currently expose cursor pagination, so this
+        issues a single request sized at page_size and yields monitors one
+        at a time. Callers can stop early (e.g. once a selection is made)
+        without paying for downstream processing of the whole tail.
+
+        Args:
+            page_size (int, optional): Maximum number of monitors to fetch
+            **filters: Additional filter arguments accepted by get_monitors
+
+        Yields:
+            dict: Monitor dictionaries
+        """
+        for monitor in self.get_monitors(limit=page_size, **filters):
+            yield monitor
+
+    def iter_job_executions(self, monitor_uuid=None, custom_rule_uuid=None,
+                            history_days=30, page_size=100):
+        """Iterate monitor run executions across all pages
+
+        Follows pageInfo.endCursor internally so callers consume a single
+        stream of executions instead of stitching pages together manually.
+
+        Args:
+            monitor_uuid (str, optional): UUID of the monitor
+            custom_rule_uuid (str, optional): UUID of the custom rule
+            history_days (int, optional): Number of days of history to return
+            page_size (int, optional): Number of executions to fetch per page
+
+        Yields:
+            dict: Execution dictionaries
+        """
+        cursor = None
+
+        while True:
+            page = self.get_job_executions(
+                monitor_uuid=monitor_uuid,
+                custom_rule_uuid=custom_rule_uuid,
+                history_days=history_days,
+                first=page_size,
+                cursor=cursor
+            )
+
+            executions = page.get("executions") or []
+            for execution in executions:
+                yield execution
+
+            pagination = page.get("pagination") or {}
+            if not pagination.get("hasNextPage"):
+                break
+
+            cursor = pagination.get("endCursor")
+            if not cursor:
+                break
 
     def get_custom_rule(self, rule_id):
         """Get details of a Custom SQL Monitor
@@ -171,31 +311,12 @@ class MonitorManager:
         Returns:
             dict: Custom rule details
         """
-        # Prepare the query
-        query = """
-        query getCustomRule($ruleId: String!) {
-          getCustomRule(ruleId: $ruleId) {
-            intervalMinutes
-            comparisons {
-              comparisonType
-              metric
-              operator
-              threshold
-            }
-            description
-            timezone
-            startTime
-            customSql
-          }
-        }
-        """
-        
         # Execute the query
-        result = self.mc_client.execute_query(query, {"ruleId": rule_id})
-        
-        if hasattr(result, 'get_custom_rule') and result.get_custom_rule:
-            return deep_dict_convert(result.get_custom_rule)
-        
+        result = self.mc_client.execute_ast(_GET_CUSTOM_RULE_AST, {"ruleId": rule_id})
+
+        if isinstance(result, dict) and result.get('getCustomRule'):
+            return result['getCustomRule']
+
         LOGGER.error(f"Failed to get custom rule: {rule_id}")
         return None
     
@@ -221,19 +342,6 @@ class MonitorManager:
             LOGGER.error("Missing required parameters for custom SQL monitor")
             return None
         
-        # Prepare the mutation
-        mutation = """
-        mutation createOrUpdateCustomSqlRule($input: CreateOrUpdateCustomSqlRuleInput!) {
-          createOrUpdateCustomSqlRule(input: $input) {
-            customRule {
-              uuid
-              creatorId
-              description
-            }
-          }
-        }
-        """
-        
         # Prepare input variables
         input_vars = {
             "description": description,
@@ -248,16 +356,107 @@ class MonitorManager:
             input_vars["uuid"] = uuid
         
         # Execute the mutation
-        result = self.mc_client.execute_query(mutation, {"input": input_vars})
-        
-        if hasattr(result, 'create_or_update_custom_sql_rule') and result.create_or_update_custom_sql_rule:
-            rule = result.create_or_update_custom_sql_rule.custom_rule
-            LOGGER.info(f"{'Updated' if uuid else 'Created'} custom SQL rule: {rule.uuid}")
-            return deep_dict_convert(rule)
-        
+        result = self.mc_client.execute_ast(_CREATE_OR_UPDATE_CUSTOM_SQL_RULE_AST,
+                                            {"input": input_vars})
+
+        if isinstance(result, dict) and result.get('createOrUpdateCustomSqlRule'):
+            rule = result['createOrUpdateCustomSqlRule'].get('customRule')
+            if rule:
+                LOGGER.info(f"{'Updated' if uuid else 'Created'} custom SQL rule: {rule.get('uuid')}")
+                return rule
+
         LOGGER.error(f"Failed to {'update' if uuid else 'create'} custom SQL rule")
         return None
-    
+
+    def bulk_create_or_update_custom_sql_rules(self, params_list):
+        """Create or update multiple Custom SQL Monitors in batched requests
+
+        Combines the per-monitor mutations into aliased GraphQL documents
+        (m0, m1, ...) so a batch of rules costs one HTTP round-trip instead
+        of one per rule. Batches larger than MAX_MUTATION_BATCH are chunked
+        to stay under the server's query complexity limit.
+
+        Args:
+            params_list (list): List of parameter dicts, one per monitor,
+                with the same keys accepted by create_or_update_custom_sql_rule
+
+        Returns:
+            list: Created or updated monitor info dicts, in input order,
+                with None for entries that were invalid or failed
+        """
+        results = [None] * len(params_list)
+
+        for chunk_start in range(0, len(params_list), MAX_MUTATION_BATCH):
+            chunk = params_list[chunk_start:chunk_start + MAX_MUTATION_BATCH]
+
+            declarations = []
+            fields = []
+            variables = {}
+            # Map alias index back to position in params_list
+            alias_positions = {}
+
+            for index, params in enumerate(chunk):
+                # Extract required parameters
+                description = params.get('description')
+                dw_id = params.get('dwId')
+                sql = params.get('sql')
+                schedule_config = params.get('scheduleConfig')
+                alert_condition = params.get('alertCondition')
+                uuid = params.get('uuid')
+
+                # Validate required parameters
+                if not all([description, dw_id, sql, schedule_config, alert_condition]):
+                    LOGGER.error("Missing required parameters for custom SQL monitor, skipping entry")
+                    continue
+
+                input_vars = {
+                    "description": description,
+                    "dwId": dw_id,
+                    "sql": sql,
+                    "scheduleConfig": schedule_config,
+                    "alertCondition": alert_condition
+                }
+
+                # Add UUID if updating an existing monitor
+                if uuid:
+                    input_vars["uuid"] = uuid
+
+                declarations.append(f"$i{index}: CreateOrUpdateCustomSqlRuleInput!")
+                fields.append(
+                    f"m{index}: createOrUpdateCustomSqlRule(input: $i{index}) {{\n"
+                    "            customRule {\n"
+                    "              uuid\n"
+                    "              creatorId\n"
+                    "              description\n"
+                    "            }\n"
+                    "          }"
+                )
+                variables[f"i{index}"] = input_vars
+                alias_positions[index] = chunk_start + index
+
+            if not fields:
+                continue
+
+            # Compose the batched mutation document
+            mutation = (
+                "mutation bulkCreateOrUpdateCustomSqlRules(" + ", ".join(declarations) + ") {\n"
+                + "\n".join(f"          {field}" for field in fields)
+                + "\n        }"
+            )
+
+            # Execute the batch in a single round-trip
+            result = self.mc_client.execute_query(mutation, variables)
+
+            # Demultiplex the result by alias
+            for index, position in alias_positions.items():
+                alias_result = result.get(f"m{index}") if isinstance(result, dict) else None
+                if alias_result and alias_result.get('customRule'):
+                    results[position] = alias_result['customRule']
+                    continue
+                LOGGER.error(f"Batched custom SQL rule mutation m{index} failed")
+
+        return results
+
     def create_or_update_metric_monitor(self, params):
         """Create or update a Metric Monitor
         
@@ -267,33 +466,20 @@ class MonitorManager:
         Returns:
             dict: Created or updated monitor info
         """
-        # Convert params to plain dict
-        input_params = deep_dict_convert(params)
-        
-        # Prepare the mutation
-        mutation = """
-        mutation createOrUpdateMetricMonitor($input: CreateOrUpdateMetricMonitorInput!) {
-          createOrUpdateMetricMonitor(input: $input) {
-            metricMonitor {
-              uuid
-              name
-              description
-              createdBy {
-                email
-              }
-            }
-          }
-        }
-        """
+        # Params from the bulk-edit templates are already plain dicts; only
+        # convert when handed something else
+        input_params = params if isinstance(params, dict) else deep_dict_convert(params)
         
         # Execute the mutation
-        result = self.mc_client.execute_query(mutation, {"input": input_params})
-        
-        if hasattr(result, 'create_or_update_metric_monitor') and result.create_or_update_metric_monitor:
-            monitor = result.create_or_update_metric_monitor.metric_monitor
-            LOGGER.info(f"{'Updated' if 'uuid' in params else 'Created'} metric monitor: {monitor.uuid}")
-            return deep_dict_convert(monitor)
-        
+        result = self.mc_client.execute_ast(_CREATE_OR_UPDATE_METRIC_MONITOR_AST,
+                                            {"input": input_params})
+
+        if isinstance(result, dict) and result.get('createOrUpdateMetricMonitor'):
+            monitor = result['createOrUpdateMetricMonitor'].get('metricMonitor')
+            if monitor:
+                LOGGER.info(f"{'Updated' if 'uuid' in params else 'Created'} metric monitor: {monitor.get('uuid')}")
+                return monitor
+
         LOGGER.error(f"Failed to {'update' if 'uuid' in params else 'create'} metric monitor")
         return None
         
@@ -311,40 +497,6 @@ class MonitorManager:
         Returns:
             dict: Dictionary with executions list and pagination info
         """
-        # Prepare the query
-        query = """
-        query getJobExecutions($customRuleUuid: String,
-                             $monitorUuid: String,
-                             $historyDays: Int,
-                             $cursor: String,
-                             $first: Int) {
-          getJobExecutions(customRuleUuid: $customRuleUuid,
-                         monitorUuid: $monitorUuid,
-                         historyDays: $historyDays,
-                         after: $cursor,
-                         first: $first) {
-            pageInfo {
-              endCursor
-              hasNextPage
-            }
-            edges {
-              node {
-                jobExecutionUuid
-                startTime
-                endTime
-                status
-                exceptions
-                exceptionsDetail {
-                  type
-                  description
-                  sqlQuery
-                }
-              }
-            }
-          }
-        }
-        """
-        
         # Prepare variables
         variables = {
             "historyDays": history_days,
@@ -359,30 +511,115 @@ class MonitorManager:
         
         if cursor:
             variables["cursor"] = cursor
-        
+
         # Execute the query
-        result = self.mc_client.execute_query(query, variables)
-        
-        if hasattr(result, 'get_job_executions') and result.get_job_executions:
+        result = self.mc_client.execute_ast(_GET_JOB_EXECUTIONS_AST, variables)
+
+        if isinstance(result, dict) and result.get('getJobExecutions'):
+            job_executions = result['getJobExecutions']
+
             executions = []
-            
-            if hasattr(result.get_job_executions, 'edges'):
-                for edge in result.get_job_executions.edges:
-                    if hasattr(edge, 'node'):
-                        executions.append(deep_dict_convert(edge.node))
-            
+            for edge in job_executions.get('edges') or []:
+                node = edge.get('node')
+                if node:
+                    executions.append(node)
+
             # Add pagination info
             pagination = {}
-            if hasattr(result.get_job_executions, 'page_info'):
+            page_info = job_executions.get('pageInfo')
+            if page_info:
                 pagination = {
-                    "endCursor": result.get_job_executions.page_info.end_cursor,
-                    "hasNextPage": result.get_job_executions.page_info.has_next_page
+                    "endCursor": page_info.get('endCursor'),
+                    "hasNextPage": page_info.get('hasNextPage')
                 }
-            
+
             return {
                 "executions": executions,
                 "pagination": pagination
             }
-        
+
         LOGGER.error("Failed to get job executions")
-        return {"executions": [], "pagination": {}}
\ No newline at end of file
+        return {"executions": [], "pagination": {}}
+
+    async def async_get_monitors(self, limit=100, monitor_types=None, mcons=None, uuids=None,
+                                 labels=None, tags=None, domain_id=None,
+                                 consolidated_status_types=None, include_ootb_monitors=None,
+                                 alerted_only=None, fields=None):
+        """Async variant of get_monitors
+
+        Requires the manager to be constructed with an AsyncMonteCarloClient.
+        Accepts the same arguments and returns the same monitor list.
+        """
+        query, variables = _build_get_monitors_request(
+            limit, monitor_types, mcons, uuids, labels, tags, domain_id,
+            consolidated_status_types, include_ootb_monitors, alerted_only, fields)
+
+        result = await self.mc_client.execute_query(query, variables)
+
+        monitors = result.get('getMonitors') if isinstance(result, dict) else None
+
+        if not monitors:
+            LOGGER.error("Failed to get monitors")
+            return []
+
+        return monitors
+
+    async def async_create_or_update_custom_sql_rule(self, params):
+        """Async variant of create_or_update_custom_sql_rule
+
+        Requires the manager to be constructed with an AsyncMonteCarloClient.
+        """
+        # Extract required parameters
+        description = params.get('description')
+        dw_id = params.get('dwId')
+        sql = params.get('sql')
+        schedule_config = params.get('scheduleConfig')
+        alert_condition = params.get('alertCondition')
+        uuid = params.get('uuid')
+
+        # Validate required parameters
+        if not all([description, dw_id, sql, schedule_config, alert_condition]):
+            LOGGER.error("Missing required parameters for custom SQL monitor")
+            return None
+
+        input_vars = {
+            "description": description,
+            "dwId": dw_id,
+            "sql": sql,
+            "scheduleConfig": schedule_config,
+            "alertCondition": alert_condition
+        }
+
+        if uuid:
+            input_vars["uuid"] = uuid
+
+        result = await self.mc_client.execute_query(_CREATE_OR_UPDATE_CUSTOM_SQL_RULE_MUTATION,
+                                                    {"input": input_vars})
+
+        if isinstance(result, dict) and result.get('createOrUpdateCustomSqlRule'):
+            rule = result['createOrUpdateCustomSqlRule'].get('customRule')
+            if rule:
+                LOGGER.info(f"{'Updated' if uuid else 'Created'} custom SQL rule: {rule.get('uuid')}")
+                return rule
+
+        LOGGER.error(f"Failed to {'update' if uuid else 'create'} custom SQL rule")
+        return None
+
+    async def async_create_or_update_metric_monitor(self, params):
+        """Async variant of create_or_update_metric_monitor
+
+        Requires the manager to be constructed with an AsyncMonteCarloClient.
+        """
+        input_params = params if isinstance(params, dict) else deep_dict_convert(params)
+
+        result = await self.mc_client.execute_query(_CREATE_OR_UPDATE_METRIC_MONITOR_MUTATION,
+                                                    {"input": input_params})
+
+        if isinstance(result, dict) and result.get('createOrUpdateMetricMonitor'):
+            monitor = result['createOrUpdateMetricMonitor'].get('metricMonitor')
+            if monitor:
+                LOGGER.info(f"{'Updated' if 'uuid' in params else 'Created'} metric monitor: {monitor.get('uuid')}")
+                return monitor
+
+        LOGGER.error(f"Failed to {'update' if 'uuid' in params else 'create'} metric monitor")
+        return None
\ No newline at end of file
@@ -6,19 +6,284 @@ This module provides functions for handling different monitor types in Monte Car
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List
 import time
 
 from mc_client import deep_dict_convert
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-LOGGER = logging.getLogger()
+# orjson is optional - it serializes the large result dicts dumped into
+# debug logs far faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Library module: handler/format configuration is left to the application
+# entry point (see bulk_edit_monitors.py); the NullHandler keeps records
+# from falling through to lastResort when none is configured
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+# Maximum number of UUIDs per batched getMonitors call, to stay under
+# server-side query complexity limits
+MAX_RULE_BATCH = 50
+
+# Query and mutation documents, hoisted to module level so repeated calls
+# reuse the same string objects (and hit the client-side parse cache)
+# The slim selection covers everything the update paths actually read
+# (uuid/name/description/monitorType); the full variant adds the status
+# and timing fields for callers that ask for them explicitly
+_GET_MONITORS_BY_UUID_QUERY = """
+query getMonitorsByUuid($uuids: [String]) {
+  getMonitors(uuids: $uuids) {
+    uuid
+    name
+    description
+    monitorType
+  }
+}
+"""
+
+_GET_MONITORS_BY_UUID_FULL_QUERY = """
+query getMonitorsByUuid($uuids: [String]) {
+  getMonitors(uuids: $uuids) {
+    uuid
+    name
+    description
+    monitorType
+    consolidatedMonitorStatus
+    dataQualityDimension
+    createdTime
+    prevExecutionTime
+  }
+}
+"""
+
+_PAUSE_MONITOR_MUTATION = """
+mutation pauseMonitor($uuid: UUID!, $pause: Boolean!) {
+  pauseMonitor(uuid: $uuid, pause: $pause) {
+    uuid
+  }
+}
+"""
+
+_UPDATE_MONITORS_SCHEDULES_MUTATION = """
+mutation updateMonitorsSchedules($monitorUuids: [UUID!]!, $scheduleConfig: ScheduleConfigInput!) {
+  updateMonitorsSchedules(
+    monitorUuids: $monitorUuids
+    scheduleConfig: $scheduleConfig
+  ) {
+    success
+  }
+}
+"""
+
+_UPDATE_MONITOR_DESCRIPTION_MUTATION = """
+mutation updateMonitorDescription($monitorUuid: UUID!, $description: String!) {
+  updateMonitorDescription(monitorUuid: $monitorUuid, description: $description) {
+    success
+  }
+}
+"""
+
+# Both update fields in one document: GraphQL executes top-level mutation
+# fields sequentially in a single request, so updating schedule and
+# description together costs one round-trip instead of two
+_UPDATE_SCHEDULE_AND_DESCRIPTION_MUTATION = """
+mutation updateScheduleAndDescription($monitorUuids: [UUID!]!, $scheduleConfig: ScheduleConfigInput!, $monitorUuid: UUID!, $description: String!) {
+  updateMonitorsSchedules(
+    monitorUuids: $monitorUuids
+    scheduleConfig: $scheduleConfig
+  ) {
+    success
+  }
+  updateMonitorDescription(monitorUuid: $monitorUuid, description: $description) {
+    success
+  }
+}
+"""
+
+_CREATE_OR_UPDATE_COMPARISON_RULE_MUTATION = """
+mutation createOrUpdateComparisonRule($input: CreateOrUpdateComparisonRuleInput!) {
+  createOrUpdateComparisonRule(input: $input) {
+    comparisonRule {
+      uuid
+    }
+  }
+}
+"""
+
+class _LazyJson:
+    """Defer JSON serialization of a log argument until a handler emits it
+
+    Passed as a lazy %s argument to the logger: __str__ only runs if the
+    record actually makes it past the level/handler checks, so suppressed
+    log calls never pay for serializing a full result dict.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        if orjson is not None:
+            return orjson.dumps(self.obj, option=orjson.OPT_INDENT_2,
+                                default=str).decode()
+        return json.dumps(self.obj, indent=2, default=str)
+
+def _is_ok(d):
+    """Check that a raw result is a dictionary without a top-level errors key
+
+    Args:
+        d: Raw result from execute_query
+
+    Returns:
+        bool: True if the result looks like a successful response
+    """
+    return isinstance(d, dict) and "errors" not in d
+
+# Known locations of the success flag per mutation. Raw gql results use the
+# camelCase operation field; results that went through older converters may
+# carry the snake_case spelling, so each operation lists its candidates in
+# the order they are likely to match.
+_SUCCESS_PATHS = {
+    'updateMonitorsSchedules': (
+        ('updateMonitorsSchedules', 'success'),
+        ('update_monitors_schedules', 'success'),
+    ),
+    'updateMonitorDescription': (
+        ('updateMonitorDescription', 'success'),
+        ('update_monitor_description', 'success'),
+    ),
+}
+
+def _extract_success(result, op_name):
+    """Pull the boolean success flag for a mutation out of a raw result
+
+    Walks the candidate paths registered for the operation in
+    _SUCCESS_PATHS; the first path that resolves to a value wins, so the
+    common case costs two dict lookups and no tree conversion.
+
+    Args:
+        result: Raw result dictionary from execute_query
+        op_name: Top-level operation field name (e.g. "updateMonitorsSchedules")
+
+    Returns:
+        bool: True if the operation reported success
+    """
+    for path in _SUCCESS_PATHS.get(op_name, ((op_name, 'success'),)):
+        value = result
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None:
+            return bool(value)
+    return False
+
+def _rule_cache(manager) -> Dict[str, Dict]:
+    """Get the per-manager cache of monitor details keyed by UUID
+
+    The cache lives on the manager instance (created lazily) so that two
+    managers pointed at different accounts never share entries.
+
+    Args:
+        manager: MonitorManager instance
+
+    Returns:
+        Dictionary mapping uuid to cached monitor configuration
+    """
+    cache = getattr(manager, '_rule_cache', None)
+    if cache is None:
+        cache = manager._rule_cache = {}
+    return cache
+
+def invalidate_rule_cache(manager, uuid: str) -> None:
+    """Drop a monitor's cached details after a successful update
+
+    Args:
+        manager: MonitorManager instance
+        uuid: UUID of the monitor whose cache entry is stale
+    """
+    getattr(manager, '_rule_cache', {}).pop(uuid, None)
+
+def clear_monitor_cache(manager) -> None:
+    """Clear every cached monitor detail for a manager
+
+    For flows that change monitor state out-of-band and need the next
+    read to re-fetch everything.
+
+    Args:
+        manager: MonitorManager instance
+    """
+    getattr(manager, '_rule_cache', {}).clear()
+
+def _get_custom_rule_cached(manager, uuid: str) -> Dict:
+    """Fetch a custom SQL rule through the per-manager cache
+
+    Args:
+        manager: MonitorManager instance
+        uuid: UUID of the custom SQL rule
+
+    Returns:
+        Dictionary with rule details, or whatever get_custom_rule returned
+        on a miss
+    """
+    cache = _rule_cache(manager)
+    cached = cache.get(uuid)
+    if cached is not None:
+        return cached
+
+    rule = manager.get_custom_rule(uuid)
+    if rule:
+        cache[uuid] = rule
+    return rule
+
+def get_rules_bulk(manager, uuids: List[str], detail: bool = False) -> Dict[str, Dict]:
+    """
+    Get detailed configuration for many monitors with batched queries
+
+    getMonitors already accepts a list of UUIDs, so one call per chunk of
+    up to MAX_RULE_BATCH monitors replaces one call per monitor - the
+    per-rule fetchers below are thin wrappers over this. Monitors already
+    in the per-manager cache are served without a network call at all;
+    updates invalidate their entries via invalidate_rule_cache.
+
+    Args:
+        manager: MonitorManager instance
+        uuids: UUIDs of the monitors to fetch
+        detail: Request the full selection set (status and timing fields)
+            instead of the slim one the update paths need
+
+    Returns:
+        Dictionary mapping uuid to monitor configuration (missing monitors
+        are simply absent from the result)
+    """
+    rules = {}
+    cache = _rule_cache(manager)
+
+    misses = []
+    for uuid in uuids:
+        cached = cache.get(uuid)
+        # A slim cache entry can't satisfy a detail request
+        if cached is not None and (not detail or 'createdTime' in cached):
+            rules[uuid] = cached
+        else:
+            misses.append(uuid)
+
+    query = _GET_MONITORS_BY_UUID_FULL_QUERY if detail else _GET_MONITORS_BY_UUID_QUERY
+
+    for start in range(0, len(misses), MAX_RULE_BATCH):
+        chunk = misses[start:start + MAX_RULE_BATCH]
+        result = manager.mc_client.execute_query(query, {"uuids": chunk})
+
+        if isinstance(result, dict):
+            for monitor in result.get("getMonitors") or []:
+                if monitor.get("uuid"):
+                    rules[monitor["uuid"]] = monitor
+                    cache[monitor["uuid"]] = monitor
+
+    return rules
 
 def get_validation_rule(manager, uuid: str) -> Dict:
     """
@@ -31,54 +296,21 @@ def get_validation_rule(manager, uuid: str) -> Dict:
     Returns:
         Dictionary with rule configuration
     """
-    # First try to get basic info using getMonitors query
-    monitors = manager.get_monitors(uuids=[uuid])
-    
-    if not monitors or len(monitors) == 0:
-        LOGGER.error(f"Monitor with UUID {uuid} not found")
-        return {}
-    
-    monitor = monitors[0]
-    
-    # For VALIDATION monitors, start with basic info
-    validation_config = {
-        "uuid": uuid,
-        "name": monitor.get("name", ""),
-        "description": monitor.get("description", ""),
-        "monitorType": monitor.get("monitorType", "VALIDATION")
-    }
-    
-    # Use the query to get more details
-    query = """
-    query getMonitorByUuid($uuids: [String]) {
-      getMonitors(uuids: $uuids) {
-        uuid
-        name
-        description
-        monitorType
-        consolidatedMonitorStatus
-        dataQualityDimension
-        createdTime
-        prevExecutionTime
-      }
-    }
-    """
-    
+    # One batched getMonitors fetch covers both the basic info and the
+    # details - the old separate "basic info" query returned a subset of
+    # the same selection set
     try:
-        result = manager.mc_client.execute_query(query, {"uuids": [uuid]})
-        
-        if result and "data" in result._data and "getMonitors" in result._data["data"] and result._data["data"]["getMonitors"]:
-            details = result._data["data"]["getMonitors"][0]
-            validation_config.update(details)
-            LOGGER.info(f"Retrieved details for Validation Monitor: {uuid}")
-            return validation_config
+        details = get_rules_bulk(manager, [uuid]).get(uuid)
     except Exception as e:
         LOGGER.error(f"Error getting validation details: {str(e)}")
-        # Continue with basic info if detailed query fails
-    
-    # If we couldn't get detailed info, return what we have
-    LOGGER.info(f"Retrieved basic info for Validation Monitor: {uuid}")
-    return validation_config
+        return {}
+
+    if not details:
+        LOGGER.error(f"Monitor with UUID {uuid} not found")
+        return {}
+
+    LOGGER.info(f"Retrieved details for Validation Monitor: {uuid}")
+    return details
 
 def get_comparison_rule(manager, uuid: str) -> Dict:
     """
@@ -91,30 +323,7 @@ def get_comparison_rule(manager, uuid: str) -> Dict:
     Returns:
         Dictionary with rule configuration
     """
-    # Prepare the query to get comparison rule details using getMonitors
-    query = """
-    query getComparisonRule($uuids: [String]) {
-      getMonitors(uuids: $uuids) {
-        uuid
-        name
-        description
-        monitorType
-        consolidatedMonitorStatus
-        dataQualityDimension
-        createdTime
-        prevExecutionTime
-      }
-    }
-    """
-    
-    # Execute the query
-    result = manager.mc_client.execute_query(query, {"uuids": [uuid]})
-    
-    if result and "data" in result._data and "getMonitors" in result._data["data"] and result._data["data"]["getMonitors"]:
-        rule_dict = result._data["data"]["getMonitors"][0]
-        return rule_dict
-    
-    return {}
+    return get_rules_bulk(manager, [uuid]).get(uuid, {})
 
 def get_stats_rule(manager, uuid: str) -> Dict:
     """
@@ -127,131 +336,250 @@ def get_stats_rule(manager, uuid: str) -> Dict:
     Returns:
         Dictionary with rule configuration
     """
-    # Use the query to get a metric monitor by UUID
-    query = """
-    query getMetricMonitor($uuids: [String]) {
-      getMonitors(uuids: $uuids) {
-        uuid
-        name
-        description
-        monitorType
-        consolidatedMonitorStatus
-        dataQualityDimension
-        createdTime
-        prevExecutionTime
-      }
-    }
+    return get_rules_bulk(manager, [uuid]).get(uuid, {})
+
+def get_monitor_details_bulk(manager, monitors: List[Dict]) -> Dict[str, Dict]:
     """
-    
-    # Execute the query
-    result = manager.mc_client.execute_query(query, {"uuids": [uuid]})
-    
-    if result and "data" in result._data and "getMonitors" in result._data["data"] and result._data["data"]["getMonitors"]:
-        monitor_dict = result._data["data"]["getMonitors"][0]
-        return monitor_dict
-    
-    return {}
+    Get detailed configuration for many monitors in as few requests as possible
+
+    Monitors whose details come from getMonitors (VALIDATION, COMPARISON,
+    STATS, METRIC) share one batched query via get_rules_bulk. CUSTOM_SQL
+    monitors need getCustomRule, so those are merged into a single aliased
+    document (m0, m1, ...) per chunk instead of one request each. Monitor
+    types without a detail query keep their basic info, matching
+    get_monitor_details.
+
+    Args:
+        manager: MonitorManager instance
+        monitors: List of monitor dictionaries with basic info
+
+    Returns:
+        Dictionary mapping uuid to detailed monitor configuration
+    """
+    details_by_uuid = {}
+    custom_sql_monitors = []
+    batched_uuids = []
+
+    for monitor in monitors:
+        uuid = monitor.get('uuid')
+        if not uuid:
+            LOGGER.error("Error: Monitor has no UUID.")
+            continue
+
+        monitor_type = monitor.get('monitorType')
+        if monitor_type == 'CUSTOM_SQL':
+            custom_sql_monitors.append(monitor)
+        elif monitor_type in ('VALIDATION', 'COMPARISON', 'STATS', 'METRIC'):
+            batched_uuids.append(uuid)
+        else:
+            # No detail query for this type - keep the basic info we have
+            details_by_uuid[uuid] = monitor
+
+    if batched_uuids:
+        details_by_uuid.update(get_rules_bulk(manager, batched_uuids))
+
+    # Custom SQL rules come from getCustomRule; serve cached entries first,
+    # then alias the remaining lookups into one document per chunk
+    cache = _rule_cache(manager)
+    custom_sql_misses = []
+    for monitor in custom_sql_monitors:
+        cached = cache.get(monitor['uuid'])
+        if cached is not None:
+            details_by_uuid[monitor['uuid']] = cached
+        else:
+            custom_sql_misses.append(monitor)
+
+    for start in range(0, len(custom_sql_misses), MAX_RULE_BATCH):
+        chunk = custom_sql_misses[start:start + MAX_RULE_BATCH]
+
+        declarations = []
+        fields = []
+        variables = {}
+
+        for index, monitor in enumerate(chunk):
+            declarations.append(f"$r{index}: String!")
+            fields.append(
+                f"m{index}: getCustomRule(ruleId: $r{index}) {{\n"
+                "        intervalMinutes\n"
+                "        comparisons {\n"
+                "          comparisonType\n"
+                "          metric\n"
+                "          operator\n"
+                "          threshold\n"
+                "        }\n"
+                "        description\n"
+                "        timezone\n"
+                "        startTime\n"
+                "        customSql\n"
+                "      }"
+            )
+            variables[f"r{index}"] = monitor['uuid']
+
+        query = (
+            "query bulkGetCustomRules(" + ", ".join(declarations) + ") {\n"
+            + "\n".join(f"      {field}" for field in fields)
+            + "\n    }"
+        )
+
+        result = manager.mc_client.execute_query(query, variables)
+
+        for index, monitor in enumerate(chunk):
+            uuid = monitor['uuid']
+            rule = result.get(f"m{index}") if isinstance(result, dict) else None
+
+            # Fall back to the per-monitor fetch if the alias came back empty
+            if not rule:
+                rule = manager.get_custom_rule(uuid)
+
+            if rule:
+                # Keep the basic info (uuid, monitorType) alongside the rule details
+                merged = dict(monitor)
+                merged.update(rule)
+                details_by_uuid[uuid] = merged
+                cache[uuid] = merged
+            else:
+                LOGGER.error(f"Error: Could not retrieve details for monitor: {uuid}")
+
+    return details_by_uuid
+
+@lru_cache(maxsize=1)
+def _default_start_time_for_hour(hour_bucket: int) -> str:
+    """Build the default schedule start time for a given wall-clock hour
+
+    Args:
+        hour_bucket: Current hour since the epoch, used purely as a cache key
+
+    Returns:
+        ISO-formatted 02:00 UTC timestamp string with a Z suffix
+    """
+    return datetime.utcnow().replace(hour=2, minute=0, second=0).isoformat() + 'Z'
+
+def _default_start_time() -> str:
+    """Default schedule start time (02:00 UTC today), shared within the hour
+
+    Called only on paths that lack an explicit startTime; bulk loops hit
+    this once per monitor, and keying the cache on the current hour lets
+    every call in a run share one string while the default still tracks
+    the date. Shared with monitor_utils, which imports it for templates
+    and the schedule example.
+
+    Returns:
+        ISO-formatted timestamp string with a Z suffix
+    """
+    return _default_start_time_for_hour(int(time.time() // 3600))
+
+# Detail fetcher per monitor type; a dict lookup replaces the former
+# if/elif chain and keeps the supported types enumerable for bulk fetching
+_FETCHERS = {
+    'CUSTOM_SQL': _get_custom_rule_cached,
+    'VALIDATION': get_validation_rule,
+    'COMPARISON': get_comparison_rule,
+    'STATS': get_stats_rule,
+    'METRIC': get_stats_rule,
+}
 
 def get_monitor_details(manager, monitor: Dict) -> Dict:
     """
     Get detailed configuration for a monitor
-    
+
     Args:
         manager: MonitorManager instance
         monitor: Monitor dictionary with basic info
-        
+
     Returns:
         Dictionary with detailed monitor configuration
     """
     uuid = monitor.get('uuid')
     monitor_type = monitor.get('monitorType')
-    
+
     if not uuid:
         LOGGER.error("Error: Monitor has no UUID.")
         return {}
-    
-    if monitor_type == 'CUSTOM_SQL':
-        details = manager.get_custom_rule(uuid)
-        if details:
-            LOGGER.info(f"Retrieved details for Custom SQL Monitor: {uuid}")
-            return details
-    elif monitor_type == 'VALIDATION':
-        details = get_validation_rule(manager, uuid)
-        if details:
-            LOGGER.info(f"Retrieved details for Validation Monitor: {uuid}")
-            return details
-    elif monitor_type == 'COMPARISON':
-        details = get_comparison_rule(manager, uuid)
-        if details:
-            LOGGER.info(f"Retrieved details for Comparison Monitor: {uuid}")
-            return details
-    elif monitor_type in ['STATS', 'METRIC']:
-        details = get_stats_rule(manager, uuid)
-        if details:
-            LOGGER.info(f"Retrieved details for {monitor_type} Monitor: {uuid}")
-            return details
-    else:
+
+    fetcher = _FETCHERS.get(monitor_type)
+    if fetcher is None:
         # For other monitor types, return the basic info we have
         LOGGER.info(f"Getting details for {monitor_type} monitor is not yet implemented.")
         return monitor
-    
+
+    details = fetcher(manager, uuid)
+    if details:
+        LOGGER.info(f"Retrieved details for {monitor_type} Monitor: {uuid}")
+        return details
+
     LOGGER.error(f"Error: Could not retrieve details for monitor: {uuid}")
     return {}
 
-def pause_unpause_monitor(manager, uuid: str) -> bool:
+def _wait_for_pause_state(manager, uuid: str, settle_timeout: float):
+    """
+    Poll until a monitor reports a paused status or the timeout elapses
+
+    Replaces a fixed sleep between the pause and unpause mutations: the
+    wait returns as soon as the server reflects the pause, polling with
+    exponential backoff (10 ms doubling, capped at 500 ms).
+
+    Args:
+        manager: MonitorManager instance
+        uuid: UUID of the monitor
+        settle_timeout: Maximum seconds to wait; 0 skips the wait entirely
+    """
+    if settle_timeout <= 0:
+        return
+
+    deadline = time.monotonic() + settle_timeout
+    delay = 0.01
+
+    while True:
+        try:
+            monitors = manager.get_monitors(
+                uuids=[uuid], fields=["uuid", "consolidatedMonitorStatus"])
+        except Exception as e:
+            LOGGER.warning(f"Could not poll pause state for {uuid}: {str(e)}")
+            return
+
+        if monitors and monitors[0].get("consolidatedMonitorStatus") == "PAUSED":
+            return
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.5)
+
+def pause_unpause_monitor(manager, uuid: str, settle_timeout: float = 1.0) -> bool:
     """
     Pause and then unpause a monitor
-    
+
     Args:
         manager: MonitorManager instance
         uuid: UUID of the monitor
-        
+        settle_timeout: Maximum seconds to wait for the pause to be
+            reflected server-side before unpausing; 0 skips the wait
+
     Returns:
         Boolean indicating success
     """
     try:
-        # The mutation for pausing/unpausing a monitor
-        pause_mutation = """
-        mutation pauseMonitor($uuid: UUID!, $pause: Boolean!) {
-          pauseMonitor(uuid: $uuid, pause: $pause) {
-            uuid
-          }
-        }
-        """
-        
         # First pause
         LOGGER.info(f"Pausing monitor: {uuid}")
-        result1 = manager.mc_client.execute_query(pause_mutation, {"uuid": uuid, "pause": True})
-        
-        # Convert to dict if it's a DictToObject
-        result1_dict = deep_dict_convert(result1)
-        
-        # Improved debug information
-        LOGGER.info(f"Pause response: {result1_dict}")
-        
-        # Wait a moment
-        time.sleep(2)
-        
+        result1_dict = manager.mc_client.execute_query(_PAUSE_MONITOR_MUTATION,
+                                                       {"uuid": uuid, "pause": True})
+
+        LOGGER.debug("Pause response: %r", result1_dict)
+
+        # Wait for the pause to settle (bounded poll instead of a fixed sleep)
+        _wait_for_pause_state(manager, uuid, settle_timeout)
+
         # Then unpause
         LOGGER.info(f"Unpausing monitor: {uuid}")
-        result2 = manager.mc_client.execute_query(pause_mutation, {"uuid": uuid, "pause": False})
-        
-        # Convert to dict if it's a DictToObject
-        result2_dict = deep_dict_convert(result2)
-        
-        # Improved debug information
-        LOGGER.info(f"Unpause response: {result2_dict}")
+        result2_dict = manager.mc_client.execute_query(_PAUSE_MONITOR_MUTATION,
+                                                       {"uuid": uuid, "pause": False})
+
+        LOGGER.debug("Unpause response: %r", result2_dict)
         
         # Check if both responses are successful (no errors)
-        pause_success = (result1_dict is not None and 
-                        isinstance(result1_dict, dict) and
-                        "errors" not in result1_dict)
-        
-        unpause_success = (result2_dict is not None and 
-                          isinstance(result2_dict, dict) and
-                          "errors" not in result2_dict)
-        
-        if pause_success and unpause_success:
+        if _is_ok(result1_dict) and _is_ok(result2_dict):
             LOGGER.info(f"Successfully paused and unpaused monitor: {uuid}")
             return True
         else:
@@ -262,6 +590,48 @@ def pause_unpause_monitor(manager, uuid: str) -> bool:
         LOGGER.error(f"Error pausing/unpausing monitor: {str(e)}")
         return False
 
+def pause_unpause_monitors(manager, uuids: List[str], max_workers: int = 10,
+                           settle_timeout: float = 1.0) -> Dict[str, bool]:
+    """
+    Pause and then unpause many monitors concurrently
+
+    Each pause/unpause cycle blocks on two HTTP round-trips plus a settle
+    wait, so running them serially costs seconds per monitor. Dispatch the
+    cycles through a thread pool so they overlap; one monitor's failure
+    doesn't stop the rest.
+
+    Args:
+        manager: MonitorManager instance
+        uuids: UUIDs of the monitors to cycle
+        max_workers: Maximum number of monitors to cycle concurrently
+        settle_timeout: Per-monitor settle wait passed to pause_unpause_monitor;
+            0 skips the wait entirely
+
+    Returns:
+        Dictionary mapping uuid to a boolean success indicator
+    """
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_uuid = {
+            executor.submit(pause_unpause_monitor, manager, uuid, settle_timeout): uuid
+            for uuid in uuids
+        }
+
+        for future in as_completed(future_to_uuid):
+            uuid = future_to_uuid[future]
+            error = future.exception()
+            if error is not None:
+                LOGGER.error(f"Error pausing/unpausing monitor {uuid}: {str(error)}")
+                results[uuid] = False
+            else:
+                results[uuid] = future.result()
+
+    success_count = sum(1 for success in results.values() if success)
+    LOGGER.info(f"Paused/unpaused {success_count} of {len(uuids)} monitors successfully")
+
+    return results
+
 def update_validation_monitor(manager, config: Dict) -> Dict:
     """
     Update a validation monitor using available API endpoints
@@ -277,7 +647,13 @@ def update_validation_monitor(manager, config: Dict) -> Dict:
     if not uuid:
         LOGGER.error("Error: Monitor has no UUID.")
         return {}
-    
+
+    # Bail out before any logging or conversion work when the config
+    # carries nothing we know how to update
+    if 'scheduleConfig' not in config and 'description' not in config:
+        LOGGER.warning(f"No update operations were attempted for monitor: {uuid}")
+        return {}
+
     # Get original description if available
     original_description = config.get('description', '')
     
@@ -288,140 +664,90 @@ def update_validation_monitor(manager, config: Dict) -> Dict:
     # Enhanced debug printing
     LOGGER.info(f"Attempting to update monitor {uuid}")
     
-    # Clone the config to avoid modifying the original
-    config_copy = deep_dict_convert(config)
-    LOGGER.info(f"Current config: {json.dumps(config_copy, indent=2)}")
+    # Nothing below mutates config, so no defensive clone is needed for the
+    # dump - the lazy wrapper serializes it only if the record is emitted
+    LOGGER.info("Current config: %s", _LazyJson(config))
     
-    # Try to update the schedule 
-    if 'scheduleConfig' in config:
-        operations_attempted += 1
+    has_schedule = 'scheduleConfig' in config
+    has_description = 'description' in config
+
+    # Create a clean schedule input without any custom objects
+    if has_schedule:
+        schedule_config = deep_dict_convert(config['scheduleConfig'])
+        schedule_payload = {
+            "scheduleType": schedule_config.get('scheduleType', 'FIXED'),
+            "intervalMinutes": schedule_config.get('intervalMinutes', 1440),
+            "startTime": schedule_config.get('startTime') or _default_start_time()
+        }
+
+    # When both fields change, send one document carrying both mutation
+    # fields: the server runs them sequentially in a single request
+    if has_schedule and has_description:
+        operations_attempted += 2
         try:
-            mutation = """
-            mutation updateMonitorsSchedules($monitorUuids: [UUID!]!, $scheduleConfig: ScheduleConfigInput!) {
-              updateMonitorsSchedules(
-                monitorUuids: $monitorUuids
-                scheduleConfig: $scheduleConfig
-              ) {
-                success
-              }
+            combined_input = {
+                "monitorUuids": [uuid],
+                "scheduleConfig": schedule_payload,
+                "monitorUuid": uuid,
+                "description": config['description']
             }
-            """
-            
-            # Prepare schedule input
-            schedule_config = deep_dict_convert(config['scheduleConfig'])
-            
-            # Create a clean input without any custom objects
+
+            result_dict = manager.mc_client.execute_query(
+                _UPDATE_SCHEDULE_AND_DESCRIPTION_MUTATION, combined_input)
+
+            LOGGER.debug("Combined update result: %r", result_dict)
+
+            # Check each operation's success independently
+            for op_name, label in (('updateMonitorsSchedules', 'schedule'),
+                                   ('updateMonitorDescription', 'description')):
+                if _extract_success(result_dict, op_name):
+                    LOGGER.info(f"Successfully updated {label} for validation monitor: {uuid}")
+                    success_count += 1
+                else:
+                    LOGGER.error(f"Failed to update {label} for validation monitor: {uuid}")
+        except Exception as e:
+            LOGGER.error(f"Error updating validation monitor schedule/description: {str(e)}")
+
+    # Otherwise fall back to the single-field mutations
+    elif has_schedule:
+        operations_attempted += 1
+        try:
             schedule_input = {
                 "monitorUuids": [uuid],
-                "scheduleConfig": {
-                    "scheduleType": schedule_config.get('scheduleType', 'FIXED'),
-                    "intervalMinutes": schedule_config.get('intervalMinutes', 1440),
-                    "startTime": schedule_config.get('startTime', 
-                        datetime.utcnow().replace(hour=2, minute=0, second=0).isoformat() + 'Z')
-                }
+                "scheduleConfig": schedule_payload
             }
-            
+
             # Execute the mutation
-            result = manager.mc_client.execute_query(mutation, schedule_input)
-            
-            # Convert result to plain dict
-            result_dict = deep_dict_convert(result)
-            
-            LOGGER.info("Schedule update result: " + json.dumps(result_dict, indent=2))
-            
-            # Improved check for success in various possible response structures
-            schedule_success = False
-            
-            # Check multiple possible paths where success might be found
-            if result_dict:
-                # Direct path in data structure
-                if 'data' in result_dict and 'updateMonitorsSchedules' in result_dict['data']:
-                    if 'success' in result_dict['data']['updateMonitorsSchedules']:
-                        schedule_success = result_dict['data']['updateMonitorsSchedules']['success']
-                
-                # Alternative path with _data
-                if '_data' in result_dict and 'updateMonitorsSchedules' in result_dict['_data']:
-                    if 'success' in result_dict['_data']['updateMonitorsSchedules']:
-                        schedule_success = result_dict['_data']['updateMonitorsSchedules']['success']
-                
-                # Check for update_monitors_schedules path
-                if 'update_monitors_schedules' in result_dict:
-                    update_path = result_dict['update_monitors_schedules']
-                    if isinstance(update_path, dict):
-                        if 'success' in update_path:
-                            if isinstance(update_path['success'], dict) and '_data' in update_path['success']:
-                                schedule_success = update_path['success']['_data']
-                            else:
-                                schedule_success = update_path['success']
-                        elif '_data' in update_path and 'success' in update_path['_data']:
-                            schedule_success = update_path['_data']['success']
-            
-            # Convert to boolean
-            schedule_success = bool(schedule_success)
-            
-            if schedule_success:
+            result_dict = manager.mc_client.execute_query(_UPDATE_MONITORS_SCHEDULES_MUTATION,
+                                                          schedule_input)
+
+            LOGGER.debug("Schedule update result: %r", result_dict)
+
+            # Check for success in the response
+            if _extract_success(result_dict, 'updateMonitorsSchedules'):
                 LOGGER.info(f"Successfully updated schedule for validation monitor: {uuid}")
                 success_count += 1
             else:
                 LOGGER.error(f"Failed to update schedule for validation monitor: {uuid}")
         except Exception as e:
             LOGGER.error(f"Error updating validation monitor schedule: {str(e)}")
-    
+
     # Handle description update with improved error handling
-    if 'description' in config:
+    elif has_description:
         operations_attempted += 1
         try:
-            mutation = """
-            mutation updateMonitorDescription($monitorUuid: UUID!, $description: String!) {
-              updateMonitorDescription(monitorUuid: $monitorUuid, description: $description) {
-                success
-              }
-            }
-            """
-            
             description_input = {
                 "monitorUuid": uuid,
                 "description": config['description']
             }
-            
-            result = manager.mc_client.execute_query(mutation, description_input)
-            
-            # Convert to a plain dict
-            result_dict = deep_dict_convert(result)
-            
-            LOGGER.info("Description update result: " + json.dumps(result_dict, indent=2))
-            
-            # Improved check for success in various possible response structures
-            description_success = False
-            
-            # Check multiple possible paths where success might be found
-            if result_dict:
-                # Direct path in data structure
-                if 'data' in result_dict and 'updateMonitorDescription' in result_dict['data']:
-                    if 'success' in result_dict['data']['updateMonitorDescription']:
-                        description_success = result_dict['data']['updateMonitorDescription']['success']
-                
-                # Alternative path with _data
-                if '_data' in result_dict and 'updateMonitorDescription' in result_dict['_data']:
-                    if 'success' in result_dict['_data']['updateMonitorDescription']:
-                        description_success = result_dict['_data']['updateMonitorDescription']['success']
-                
-                # Check for update_monitor_description path
-                if 'update_monitor_description' in result_dict:
-                    update_path = result_dict['update_monitor_description']
-                    if isinstance(update_path, dict):
-                        if 'success' in update_path:
-                            if isinstance(update_path['success'], dict) and '_data' in update_path['success']:
-                                description_success = update_path['success']['_data']
-                            else:
-                                description_success = update_path['success']
-                        elif '_data' in update_path and 'success' in update_path['_data']:
-                            description_success = update_path['_data']['success']
-            
-            # Convert to boolean
-            description_success = bool(description_success)
-            
-            if description_success:
+
+            result_dict = manager.mc_client.execute_query(_UPDATE_MONITOR_DESCRIPTION_MUTATION,
+                                                          description_input)
+
+            LOGGER.debug("Description update result: %r", result_dict)
+
+            # Check for success in the response
+            if _extract_success(result_dict, 'updateMonitorDescription'):
                 LOGGER.info(f"Successfully updated description for validation monitor: {uuid}")
                 success_count += 1
             else:
@@ -430,18 +756,17 @@ def update_validation_monitor(manager, config: Dict) -> Dict:
             LOGGER.error(f"Error updating validation monitor description: {str(e)}")
     
     # Consider the update successful if any operation succeeded
-    if operations_attempted > 0 and success_count > 0:
+    if success_count > 0:
         LOGGER.info(f"Update successful: {success_count} of {operations_attempted} operations succeeded")
+        # Cached details are stale now - force a re-fetch on the next read
+        invalidate_rule_cache(manager, uuid)
         return {
             "uuid": uuid, 
             "description": config.get('description', original_description),
             "scheduleConfig": deep_dict_convert(config.get('scheduleConfig', {}))
         }
     else:
-        if operations_attempted == 0:
-            LOGGER.warning(f"No update operations were attempted for monitor: {uuid}")
-        else:
-            LOGGER.error(f"Failed to update validation monitor: {uuid}")
+        LOGGER.error(f"Failed to update validation monitor: {uuid}")
         return {}
 
 def update_comparison_monitor(manager, config: Dict) -> Dict:
@@ -455,27 +780,17 @@ def update_comparison_monitor(manager, config: Dict) -> Dict:
     Returns:
         Updated monitor details or empty dict on failure
     """
-    # Prepare the mutation for comparison monitor with required sub-selection
-    mutation = """
-    mutation createOrUpdateComparisonRule($input: CreateOrUpdateComparisonRuleInput!) {
-      createOrUpdateComparisonRule(input: $input) {
-        comparisonRule {
-          uuid
-        }
-      }
-    }
-    """
-    
     # Convert config to plain dict
     input_config = deep_dict_convert(config)
-    
+
     # Execute the mutation
-    result = manager.mc_client.execute_query(mutation, {"input": input_config})
-    result_dict = deep_dict_convert(result)
-    
+    result_dict = manager.mc_client.execute_query(_CREATE_OR_UPDATE_COMPARISON_RULE_MUTATION,
+                                                  {"input": input_config})
+
     try:
-        if result_dict is not None and "errors" not in result_dict:
+        if _is_ok(result_dict):
             LOGGER.info(f"Updated comparison rule: {config.get('uuid')}")
+            invalidate_rule_cache(manager, config.get('uuid'))
             return {
                 'uuid': config.get('uuid'),
                 'description': config.get('description')
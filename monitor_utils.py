@@ -4,24 +4,33 @@ monitor_utils.py - Utility functions for working with Monte Carlo monitors
 This module provides utility functions for managing and updating Monte Carlo monitors.
 """
 
+import asyncio
 import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Optional, Callable
 
 from mc_client import deep_dict_convert
+
+# orjson is optional - its C encoder writes the multi-megabyte schema
+# files several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from monitor_types import (
-    get_monitor_details, update_validation_monitor,
+    _default_start_time, get_monitor_details, get_monitor_details_bulk,
+    invalidate_rule_cache, update_validation_monitor,
     update_comparison_monitor, update_stats_monitor
 )
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-LOGGER = logging.getLogger()
+# Library module: handler/format configuration is owned by the application
+# entry point (see bulk_edit_monitors.py)
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
 
 def list_monitors(manager, limit: int = 100, monitor_type: Optional[str] = None) -> List[Dict]:
     """
@@ -36,20 +45,30 @@ def list_monitors(manager, limit: int = 100, monitor_type: Optional[str] = None)
         List of monitor dictionaries
     """
     monitor_types = [monitor_type] if monitor_type else None
-    monitors = manager.get_monitors(limit=limit, monitor_types=monitor_types)
-    
+
+    # Listing only needs the fields shown below; full details are fetched
+    # later for the monitors the user actually selects. Consume the lazy
+    # iterator and stop at the limit instead of materializing a full list
+    monitors = []
+    lines = []
+    for monitor in manager.iter_monitors(page_size=limit, monitor_types=monitor_types,
+                                         fields=["uuid", "monitorType", "name", "description"]):
+        monitors.append(monitor)
+        lines.append(
+            f"{len(monitors)}. {monitor.get('name', 'Unnamed')} ({monitor.get('uuid', 'No UUID')})\n"
+            f"   Type: {monitor.get('monitorType', 'Unknown')}\n"
+            f"   Description: {monitor.get('description', 'No description')}\n"
+        )
+        if len(monitors) >= limit:
+            break
+
     if not monitors:
         LOGGER.info("No monitors found.")
         return []
-    
-    LOGGER.info(f"Found {len(monitors)} monitors:")
-    for i, monitor in enumerate(monitors, 1):
-        # Print basic info for each monitor
-        LOGGER.info(f"{i}. {monitor.get('name', 'Unnamed')} ({monitor.get('uuid', 'No UUID')})")
-        LOGGER.info(f"   Type: {monitor.get('monitorType', 'Unknown')}")
-        LOGGER.info(f"   Description: {monitor.get('description', 'No description')}")
-        print()
-    
+
+    # One joined log write instead of three records plus a print per monitor
+    LOGGER.info("Found %d monitors:\n%s", len(monitors), "\n".join(lines))
+
     return monitors
 
 def select_monitors_by_uuid(monitors: List[Dict], uuids: List[str]) -> List[Dict]:
@@ -63,16 +82,26 @@ def select_monitors_by_uuid(monitors: List[Dict], uuids: List[str]) -> List[Dict
     Returns:
         List of selected monitor dictionaries
     """
-    selected_monitors = []
-    uuid_map = {m.get('uuid'): m for m in monitors if 'uuid' in m}
-    
-    for uuid in uuids:
-        if uuid in uuid_map:
-            selected_monitors.append(uuid_map[uuid])
-        else:
-            LOGGER.warning(f"Warning: Monitor with UUID '{uuid}' not found.")
-    
-    return selected_monitors
+    uuid_map = {m['uuid']: m for m in monitors if 'uuid' in m}
+
+    # Intersect in C via the dict keys view; misses are warned about once
+    # per unique UUID rather than once per occurrence
+    hits = set(uuids) & uuid_map.keys()
+    for missing in set(uuids) - hits:
+        LOGGER.warning(f"Warning: Monitor with UUID '{missing}' not found.")
+
+    # Preserve the caller's ordering for the selected monitors
+    return [uuid_map[uuid] for uuid in uuids if uuid in hits]
+
+# Update handler per monitor type; mirrors the _FETCHERS table in
+# monitor_types so new types slot in with one entry instead of a branch
+_UPDATE_DISPATCH = {
+    'CUSTOM_SQL': lambda manager, config: manager.create_or_update_custom_sql_rule(config),
+    'VALIDATION': update_validation_monitor,
+    'COMPARISON': update_comparison_monitor,
+    'STATS': update_stats_monitor,
+    'METRIC': update_stats_monitor,
+}
 
 def update_monitor(manager, monitor: Dict, updates: Dict) -> bool:
     """
@@ -93,172 +122,320 @@ def update_monitor(manager, monitor: Dict, updates: Dict) -> bool:
         LOGGER.error("Error: Monitor has no UUID.")
         return False
     
-    # Apply updates to the monitor configuration
-    updated_config = {**monitor}
-    for key, value in updates.items():
-        updated_config[key] = value
-    
-    updated_config['uuid'] = uuid  # Ensure UUID is included
-    
-    result = None
+    # Merge the updates (and re-assert the UUID) in a single C-level dict
+    # build instead of a copy followed by a Python-level loop
+    updated_config = {**monitor, **updates, 'uuid': uuid}
     
     # Use the appropriate update method based on monitor type
-    if monitor_type == 'CUSTOM_SQL':
-        result = manager.create_or_update_custom_sql_rule(updated_config)
-    elif monitor_type == 'VALIDATION':
-        result = update_validation_monitor(manager, updated_config)
-    elif monitor_type == 'COMPARISON':
-        result = update_comparison_monitor(manager, updated_config)
-    elif monitor_type in ['STATS', 'METRIC']:
-        result = update_stats_monitor(manager, updated_config)
-    else:
+    update_fn = _UPDATE_DISPATCH.get(monitor_type)
+    if update_fn is None:
         LOGGER.error(f"Error: Updating {monitor_type} monitors is not yet implemented.")
         return False
-    
+
+    result = update_fn(manager, updated_config)
+
     if result:
         LOGGER.info(f"Successfully updated monitor: {uuid}")
+        # Cached details are stale after any successful update
+        invalidate_rule_cache(manager, uuid)
         return True
     else:
         LOGGER.error(f"Failed to update monitor: {uuid}")
         return False
 
-def bulk_update_monitors(manager, monitors: List[Dict], update_fn: Callable):
+def bulk_update_monitors(manager, monitors: List[Dict], update_fn: Callable, max_workers: int = 10):
     """
-    Apply an update function to multiple monitors
-    
+    Apply an update function to multiple monitors concurrently
+
+    The per-monitor work (detail fetch + update mutation) is network-bound,
+    so monitors are processed through a thread pool rather than one at a
+    time. Errors are isolated per monitor: one failed update does not stop
+    the rest of the batch.
+
     Args:
         manager: MonitorManager instance
         monitors: List of monitor dictionaries
         update_fn: Function that takes a monitor and returns update dictionary
+        max_workers: Maximum number of monitors to process concurrently
+
+    Returns:
+        List of per-monitor result records of the form
+        {'uuid': ..., 'status': 'updated'|'skipped'|'failed', 'error': ...}
     """
-    success_count = 0
-    fail_count = 0
-    
-    for monitor in monitors:
+    # Fetch details for the whole batch up front: a handful of batched
+    # requests instead of one round-trip per monitor
+    try:
+        details_map = get_monitor_details_bulk(manager, monitors)
+    except Exception as e:
+        LOGGER.warning(f"Bulk detail fetch failed, falling back to per-monitor fetches: {str(e)}")
+        details_map = {}
+
+    def process_monitor(monitor):
+        """Fetch details and apply updates for a single monitor
+
+        Returns True on success, False on failure, None if no update was needed.
+        """
         uuid = monitor.get('uuid')
-        LOGGER.info(f"\nProcessing monitor: {uuid}")
-        
-        # Get detailed configuration
-        detailed_config = get_monitor_details(manager, monitor)
+        LOGGER.debug("Processing monitor: %s", uuid)
+
+        # Details were prefetched for the batch; fall back to a per-monitor
+        # fetch only when the bulk result has no entry for this UUID
+        detailed_config = details_map.get(uuid) or get_monitor_details(manager, monitor)
         if not detailed_config:
             LOGGER.error(f"Skipping monitor due to missing details: {uuid}")
-            fail_count += 1
-            continue
-        
+            return False
+
         # Get updates from the update function
         updates = update_fn(detailed_config)
         if not updates:
-            LOGGER.info(f"No updates required for: {uuid}")
-            continue
-        
+            LOGGER.debug("No updates required for: %s", uuid)
+            return None
+
         # Apply the updates
-        if update_monitor(manager, detailed_config, updates):
-            success_count += 1
+        return update_monitor(manager, detailed_config, updates)
+
+    results = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_uuid = {
+            executor.submit(process_monitor, monitor): monitor.get('uuid')
+            for monitor in monitors
+        }
+
+        # Collect every outcome without letting one failure abort the batch
+        for future in as_completed(future_to_uuid):
+            uuid = future_to_uuid[future]
+            error = future.exception()
+            if error is not None:
+                record = {'uuid': uuid, 'status': 'failed', 'error': str(error)}
+            else:
+                outcome = future.result()
+                if outcome is None:
+                    # No update was required for this monitor
+                    record = {'uuid': uuid, 'status': 'skipped', 'error': None}
+                elif outcome:
+                    record = {'uuid': uuid, 'status': 'updated', 'error': None}
+                else:
+                    record = {'uuid': uuid, 'status': 'failed', 'error': 'update failed'}
+
+            results.append(record)
+            # One buffered record per monitor instead of interleaved chatter
+            LOGGER.info("Monitor %s: %s%s", uuid, record['status'],
+                        f" ({record['error']})" if record['error'] else "")
+
+    success_count = sum(1 for r in results if r['status'] == 'updated')
+    failures = [r for r in results if r['status'] == 'failed']
+
+    LOGGER.info(f"\nBulk update complete. {success_count} succeeded, {len(failures)} failed.")
+    for failure in failures:
+        LOGGER.error(f"  {failure['uuid']}: {failure['error']}")
+
+    return results
+
+async def async_bulk_update_monitors(manager, monitors: List[Dict], update_fn: Callable,
+                                     max_concurrency: int = 10):
+    """
+    Async variant of bulk_update_monitors using asyncio.gather
+
+    Runs every monitor's detail fetch and update concurrently on the event
+    loop, gated by a semaphore so the Monte Carlo API is not overwhelmed.
+    The type-specific fetchers are synchronous today, so each monitor's
+    pipeline runs in the default executor; callers on an event loop still
+    get full overlap between monitors without blocking the loop.
+
+    Args:
+        manager: MonitorManager instance
+        monitors: List of monitor dictionaries
+        update_fn: Function that takes a monitor and returns update dictionary
+        max_concurrency: Maximum number of monitors in flight at once
+
+    Returns:
+        List of per-monitor result records of the form
+        {'uuid': ..., 'status': 'updated'|'skipped'|'failed', 'error': ...},
+        matching bulk_update_monitors
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_event_loop()
+
+    # Same batched prefetch as the sync path
+    try:
+        details_map = get_monitor_details_bulk(manager, monitors)
+    except Exception as e:
+        LOGGER.warning(f"Bulk detail fetch failed, falling back to per-monitor fetches: {str(e)}")
+        details_map = {}
+
+    def process_monitor(monitor):
+        """Synchronous per-monitor pipeline, run in the executor
+
+        Returns True on success, False on failure, None if no update was needed.
+        """
+        uuid = monitor.get('uuid')
+
+        detailed_config = details_map.get(uuid) or get_monitor_details(manager, monitor)
+        if not detailed_config:
+            LOGGER.error(f"Skipping monitor due to missing details: {uuid}")
+            return False
+
+        updates = update_fn(detailed_config)
+        if not updates:
+            LOGGER.info(f"No updates required for: {uuid}")
+            return None
+
+        return update_monitor(manager, detailed_config, updates)
+
+    async def process_one(monitor):
+        """Run one monitor's pipeline and report its outcome as a record"""
+        uuid = monitor.get('uuid')
+        async with semaphore:
+            try:
+                outcome = await loop.run_in_executor(None, process_monitor, monitor)
+            except Exception as e:
+                LOGGER.error(f"Error processing monitor {uuid}: {str(e)}")
+                return {'uuid': uuid, 'status': 'failed', 'error': str(e)}
+
+        if outcome is None:
+            # No update was required for this monitor
+            record = {'uuid': uuid, 'status': 'skipped', 'error': None}
+        elif outcome:
+            record = {'uuid': uuid, 'status': 'updated', 'error': None}
         else:
-            fail_count += 1
-    
-    LOGGER.info(f"\nBulk update complete. {success_count} succeeded, {fail_count} failed.")
+            record = {'uuid': uuid, 'status': 'failed', 'error': 'update failed'}
+
+        LOGGER.debug("Finished monitor %s: %s", uuid, record['status'])
+        return record
+
+    # process_one never raises, so no return_exceptions juggling is needed
+    results = await asyncio.gather(*[process_one(m) for m in monitors])
+
+    success_count = sum(1 for r in results if r['status'] == 'updated')
+    failures = [r for r in results if r['status'] == 'failed']
+
+    LOGGER.info(f"\nBulk update complete. {success_count} succeeded, {len(failures)} failed.")
+    for failure in failures:
+        LOGGER.error(f"  {failure['uuid']}: {failure['error']}")
+
+    return results
+
+def _parse(kind: str, raw: str):
+    """Coerce a raw prompt response to the requested type
+
+    Args:
+        kind: One of "int", "float" or "bool"; anything else passes through
+        raw: Raw response string
 
-def fill_template_interactively(template: Dict) -> Dict:
+    Returns:
+        Coerced value
+    """
+    if kind == "int":
+        return int(raw)
+    if kind == "float":
+        return float(raw)
+    if kind == "bool":
+        return raw.lower() == 'true'
+    return raw
+
+def _print_api_limited_note(what: str) -> None:
+    """Print the standard notice about limited API support for a field"""
+    print(f"Note: Direct API support for {what} updates is limited.")
+    print(f"You may need to use the Monte Carlo UI for {what} changes.")
+
+def _prompt_description(field_config):
+    if input("Update description? (y/n): ").lower() != 'y':
+        return None
+    return input("Enter new description: ")
+
+def _prompt_schedule(field_config):
+    if input("Update schedule? (y/n): ").lower() != 'y':
+        return None
+
+    defaults = field_config["value"]
+    interval = input("Enter interval in minutes (e.g., 1440 for daily, blank for default): ")
+    return {
+        "scheduleType": "FIXED",
+        "intervalMinutes": _parse("int", interval) if interval else defaults["intervalMinutes"],
+        # Use default start time (2 AM UTC)
+        "startTime": defaults["startTime"],
+    }
+
+def _prompt_alert_config(field_config):
+    if input("Update alert config? (y/n): ").lower() != 'y':
+        return None
+
+    _print_api_limited_note("alert configuration")
+    defaults = field_config["value"]
+    alert_on_diff = input("Alert on difference? (true/false, blank for default): ")
+    threshold = input("Enter difference threshold % (blank for default): ")
+    return {
+        "alertOnDiff": _parse("bool", alert_on_diff) if alert_on_diff else defaults["alertOnDiff"],
+        "diffThreshold": _parse("float", threshold) if threshold else defaults["diffThreshold"],
+    }
+
+def _prompt_alert_condition(field_config):
+    if input("Update alert condition? (y/n): ").lower() != 'y':
+        return None
+
+    _print_api_limited_note("alert condition")
+    defaults = field_config["value"]
+    threshold = input("Enter threshold value (blank for default): ")
+    return {
+        # Use default values from template
+        "type": defaults["type"],
+        "operator": defaults["operator"],
+        "threshold": _parse("float", threshold) if threshold else defaults["threshold"],
+    }
+
+def _prompt_alert_conditions(field_config):
+    if input("Update alert conditions? (y/n): ").lower() != 'y':
+        return None
+
+    _print_api_limited_note("alert conditions")
+    # Use default values for now - this could be expanded for more customization
+    return field_config["value"]
+
+# Prompt handler per template field; each returns the update value or
+# None when the user skips the field
+_FIELD_HANDLERS = {
+    "description": _prompt_description,
+    "scheduleConfig": _prompt_schedule,
+    "alertConfig": _prompt_alert_config,
+    "alertCondition": _prompt_alert_condition,
+    "alertConditions": _prompt_alert_conditions,
+}
+
+def fill_template_interactively(template: Dict, responses: Dict = None) -> Dict:
     """
     Fill a template interactively with user input
-    
+
     Args:
         template: Template dictionary
-        
+        responses: Optional prepared answers keyed by field name; when
+            given, values are taken from it directly and stdin is never
+            touched, enabling scripted/batch runs
+
     Returns:
         Dictionary with user updates
     """
+    # Scripted mode: dictionary lookups instead of blocking prompts
+    if responses is not None:
+        return {field_name: responses[field_name]
+                for field_name in template if field_name in responses}
+
     updates = {}
-    
+
     print("\n=== INTERACTIVE UPDATE TEMPLATE ===")
     print("Enter values for fields you want to update (leave blank to skip):")
-    
+
     # Process each top-level field in the template
     for field_name, field_config in template.items():
+        handler = _FIELD_HANDLERS.get(field_name)
+        if handler is None:
+            continue
+
         print(f"\n--- {field_name} ---")
-        
-        # Handle description field (simple string)
-        if field_name == "description":
-            response = input(f"Update description? (y/n): ")
-            if response.lower() == 'y':
-                new_value = input(f"Enter new description: ")
-                updates[field_name] = new_value
-                continue
-        
-        # Handle scheduleConfig field
-        elif field_name == "scheduleConfig":
-            response = input(f"Update schedule? (y/n): ")
-            if response.lower() == 'y':
-                schedule = {}
-                
-                interval = input(f"Enter interval in minutes (e.g., 1440 for daily, blank for default): ")
-                if interval:
-                    schedule["intervalMinutes"] = int(interval)
-                else:
-                    schedule["intervalMinutes"] = field_config["value"]["intervalMinutes"]
-                
-                # Use default start time (2 AM UTC)
-                schedule["scheduleType"] = "FIXED"
-                schedule["startTime"] = field_config["value"]["startTime"]
-                
-                updates[field_name] = schedule
-                continue
-        
-        # Handle alertConfig for VALIDATION monitors
-        elif field_name == "alertConfig":
-            response = input(f"Update alert config? (y/n): ")
-            if response.lower() == 'y':
-                print("Note: Direct API support for alert configuration updates is limited.")
-                print("You may need to use the Monte Carlo UI for alert configuration changes.")
-                alert_config = {}
-                
-                alert_on_diff = input(f"Alert on difference? (true/false, blank for default): ")
-                if alert_on_diff:
-                    alert_config["alertOnDiff"] = alert_on_diff.lower() == 'true'
-                else:
-                    alert_config["alertOnDiff"] = field_config["value"]["alertOnDiff"]
-                
-                threshold = input(f"Enter difference threshold % (blank for default): ")
-                if threshold:
-                    alert_config["diffThreshold"] = float(threshold)
-                else:
-                    alert_config["diffThreshold"] = field_config["value"]["diffThreshold"]
-                
-                updates[field_name] = alert_config
-                continue
-        
-        # Handle alertCondition for COMPARISON and CUSTOM_SQL monitors
-        elif field_name == "alertCondition":
-            response = input(f"Update alert condition? (y/n): ")
-            if response.lower() == 'y':
-                print("Note: Direct API support for alert condition updates is limited.")
-                print("You may need to use the Monte Carlo UI for alert condition changes.")
-                alert_condition = {}
-                
-                # Use default values from template
-                alert_condition["type"] = field_config["value"]["type"]
-                alert_condition["operator"] = field_config["value"]["operator"]
-                
-                threshold = input(f"Enter threshold value (blank for default): ")
-                if threshold:
-                    alert_condition["threshold"] = float(threshold)
-                else:
-                    alert_condition["threshold"] = field_config["value"]["threshold"]
-                
-                updates[field_name] = alert_condition
-                continue
-        
-        # Handle alertConditions for METRIC/STATS monitors
-        elif field_name == "alertConditions":
-            response = input(f"Update alert conditions? (y/n): ")
-            if response.lower() == 'y':
-                print("Note: Direct API support for alert conditions updates is limited.")
-                print("You may need to use the Monte Carlo UI for alert condition changes.")
-                # Use default values for now - this could be expanded for more customization
-                updates[field_name] = field_config["value"]
-                continue
-    
+        value = handler(field_config)
+        if value is not None:
+            updates[field_name] = value
+
     return updates
 
 def create_update_template(monitor_type: str) -> Dict:
@@ -282,7 +459,7 @@ def create_update_template(monitor_type: str) -> Dict:
             "value": {
                 "scheduleType": "FIXED",
                 "intervalMinutes": 1440,  # Daily
-                "startTime": datetime.utcnow().replace(hour=2, minute=0, second=0).isoformat() + 'Z'
+                "startTime": _default_start_time()
             }
         }
     }
@@ -340,6 +517,11 @@ def apply_template_updates(monitor: Dict, updates: Dict) -> Dict:
     Returns:
         Dictionary with updates to apply
     """
+    # Fast path: templates usually skip a field or set it, so there is
+    # nothing to filter and the updates dict can be returned as-is
+    if not any(v is None for v in updates.values()):
+        return updates
+
     # Filter out empty updates
     return {k: v for k, v in updates.items() if v is not None}
 
@@ -355,7 +537,7 @@ def update_schedule_example(monitor: Dict) -> Dict:
         Dictionary with schedule updates
     """
     # Example: Change the schedule to run at 2 AM UTC daily
-    new_start_time = datetime.utcnow().replace(hour=2, minute=0, second=0).isoformat() + 'Z'
+    new_start_time = _default_start_time()
     
     if 'scheduleConfig' in monitor:
         return {
@@ -448,16 +630,69 @@ def update_alert_thresholds_example(monitor: Dict) -> Dict:
     LOGGER.info(f"No alert threshold update applicable for this monitor type: {monitor_type}")
     return {}
 
-def get_graphql_schema(mc_client):
+# Location and freshness window for the cached introspection schema
+SCHEMA_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".mcd", "schema_cache.json")
+SCHEMA_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+def _write_json(path: str, obj) -> None:
+    """Write an object to disk as compact JSON
+
+    Uses orjson when installed, falling back to the stdlib encoder with
+    compact separators.
+
+    Args:
+        path: Destination file path
+        obj: JSON-serializable object to write
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, default=str))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, separators=(',', ':'), default=str)
+
+def _matches_monitor_terms(name: str) -> bool:
+    """Check whether a schema name refers to monitors, alerts or rules
+
+    Lowercases the name once and tests the three keywords with direct
+    `in` checks - cheaper than re-building an any() generator per name
+    when filtering thousands of schema entries.
+
+    Args:
+        name: Mutation or type name from the introspection result
+
+    Returns:
+        bool: True if the name contains one of the keywords
+    """
+    lowered = name.lower()
+    return "monitor" in lowered or "alert" in lowered or "rule" in lowered
+
+def get_graphql_schema(mc_client, use_cache: bool = True):
     """
     Retrieve the full GraphQL schema using introspection and save mutations
-    
+
+    The schema rarely changes, so the introspection result is cached on
+    disk and reused for up to 24 hours; pass use_cache=False to force a
+    fresh introspection query.
+
     Args:
         mc_client: MonteCarloClient instance
-    
+        use_cache: Whether to reuse a fresh cached schema if available
+
     Returns:
         Full GraphQL schema as a dictionary
     """
+    # Fast path: reuse the cached schema without any HTTP call
+    if use_cache and os.path.exists(SCHEMA_CACHE_PATH):
+        try:
+            if time.time() - os.path.getmtime(SCHEMA_CACHE_PATH) < SCHEMA_CACHE_TTL_SECONDS:
+                with open(SCHEMA_CACHE_PATH, 'r') as f:
+                    schema_dict = json.load(f)
+                LOGGER.info(f"Loaded GraphQL schema from cache: {SCHEMA_CACHE_PATH}")
+                return schema_dict
+        except (OSError, ValueError) as e:
+            LOGGER.warning(f"Could not read schema cache, refreshing: {str(e)}")
+
     introspection_query = """
     query IntrospectionQuery {
       __schema {
@@ -534,34 +769,41 @@ def get_graphql_schema(mc_client):
     
     try:
         result = mc_client.execute_query(introspection_query)
-        
-        # Save the schema to a file for easier inspection
-        
-        # Save full schema
-        with open('mc_graphql_schema.json', 'w') as f:
-            json.dump(deep_dict_convert(result), f, indent=2)
-        
-        LOGGER.info(f"Schema saved to mc_graphql_schema.json")
-        
-        # Extract and save only mutations for easier reference
+
+        # Convert once and reuse the same dict for every consumer below
         schema_dict = deep_dict_convert(result)
-        if 'data' in schema_dict and '__schema' in schema_dict['data']:
-            schema = schema_dict['data']['__schema']
-            
+
+        # Save full schema; compact output since the file is machine-read
+        _write_json('mc_graphql_schema.json', schema_dict)
+
+        LOGGER.info(f"Schema saved to mc_graphql_schema.json")
+
+        # Refresh the on-disk cache for subsequent runs. Write compactly
+        # (the cache is machine-read only) and go through a temp file +
+        # os.replace so an interrupted write never leaves a torn cache
+        try:
+            os.makedirs(os.path.dirname(SCHEMA_CACHE_PATH), exist_ok=True)
+            tmp_path = SCHEMA_CACHE_PATH + '.tmp'
+            _write_json(tmp_path, schema_dict)
+            os.replace(tmp_path, SCHEMA_CACHE_PATH)
+            LOGGER.info(f"Schema cached to {SCHEMA_CACHE_PATH}")
+        except OSError as e:
+            LOGGER.warning(f"Could not write schema cache: {str(e)}")
+
+        if '__schema' in schema_dict:
+            schema = schema_dict['__schema']
+
             if 'mutationType' in schema and schema['mutationType'] and 'fields' in schema['mutationType']:
                 mutations = schema['mutationType']['fields']
                 
                 # Save mutations to a separate file
-                with open('mc_mutations.json', 'w') as f:
-                    json.dump(mutations, f, indent=2)
+                _write_json('mc_mutations.json', mutations)
                 
                 LOGGER.info(f"Mutations saved to mc_mutations.json")
                 
                 # Print monitor and alert related mutations
-                monitor_mutations = [
-                    f for f in mutations 
-                    if any(term in f["name"].lower() for term in ["monitor", "alert", "rule"])
-                ]
+                monitor_mutations = [f for f in mutations
+                                     if _matches_monitor_terms(f["name"])]
                 
                 LOGGER.info("\nAvailable Monitor/Alert/Rule Mutations:")
                 for mutation in monitor_mutations:
@@ -572,8 +814,7 @@ def get_graphql_schema(mc_client):
             if "types" in schema:
                 input_types = [
                     t for t in schema["types"]
-                    if t["kind"] == "INPUT_OBJECT" and 
-                    any(term in t["name"].lower() for term in ["monitor", "alert", "rule"])
+                    if t["kind"] == "INPUT_OBJECT" and _matches_monitor_terms(t["name"])
                 ]
                 
                 LOGGER.info("\nMonitor/Alert/Rule-related Input Types:")
@@ -586,7 +827,7 @@ def get_graphql_schema(mc_client):
                     
                     LOGGER.info(f"- {t['name']}: {fields}")
         
-        return deep_dict_convert(result)
+        return schema_dict
     except Exception as e:
         LOGGER.error(f"Error retrieving GraphQL schema: {e}")
         return None
\ No newline at end of file
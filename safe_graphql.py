@@ -4,53 +4,147 @@ safe_graphql.py - Safe GraphQL query execution utilities
 This module provides functions for safely executing GraphQL queries with error handling.
 """
 
-import json
 import logging
+import random
+import time
 from typing import Dict
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-LOGGER = logging.getLogger()
+import requests
+from gql.transport.exceptions import TransportQueryError
+from graphql import GraphQLError
+
+# gql 4.x wraps request-time failures (dropped connections, timeouts) in
+# TransportConnectionFailed; gql 3.x lets the underlying requests
+# exceptions propagate unwrapped
+try:
+    from gql.transport.exceptions import TransportConnectionFailed
+except ImportError:
+    TransportConnectionFailed = None
+
+# Library module: handler/format configuration is owned by the application
+# entry point
+LOGGER = logging.getLogger(__name__)
+LOGGER.addHandler(logging.NullHandler())
+
+# Retry budget for transient failures; waits grow exponentially from
+# 0.3s and are capped at 30s
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 0.3
+BACKOFF_CAP_SECONDS = 30
+
+class GraphQLQueryError(Exception):
+    """Raised when a GraphQL query still fails after all retries
+
+    Carries the original exception so callers can tell a transport
+    failure apart from a legitimately empty result.
+    """
+
+    def __init__(self, message, original=None):
+        super().__init__(message)
+        self.original = original
+
+def _status_code(error):
+    """Best-effort HTTP status code for an exception, or None"""
+    response = getattr(error, 'response', None)
+    if response is not None:
+        return getattr(response, 'status_code', None)
+    code = getattr(error, 'code', None)
+    return code if isinstance(code, int) else None
+
+def _is_retryable(error) -> bool:
+    """Decide whether an error is worth retrying
+
+    Only transient failures qualify: dropped connections, timeouts,
+    throttling (429) and server-side errors (5xx). GraphQL-level errors
+    (a malformed query or a resolver failure, delivered with a 200) fail
+    identically on every attempt, as does any local programming error,
+    so unknown exceptions are not retried.
+
+    Args:
+        error: Exception raised by execute_query
+
+    Returns:
+        bool: True if another attempt could succeed
+    """
+    if isinstance(error, (TransportQueryError, GraphQLError)):
+        return False
+    # gql 4.x delivers connection errors and timeouts wrapped; gql 3.x
+    # raises the requests exceptions directly
+    if TransportConnectionFailed is not None and isinstance(error, TransportConnectionFailed):
+        return True
+    if isinstance(error, (requests.exceptions.ConnectionError,
+                          requests.exceptions.Timeout)):
+        return True
+    status = _status_code(error)
+    return status is not None and (status == 429 or status >= 500)
+
+def _retry_delay(attempt: int, error) -> float:
+    """Seconds to sleep before the next attempt
+
+    Exponential backoff with a little jitter so concurrent workers don't
+    retry in lockstep; a server-sent Retry-After header wins when present.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        error: Exception raised by that attempt
+
+    Returns:
+        float: Delay in seconds
+    """
+    response = getattr(error, 'response', None)
+    if response is not None:
+        retry_after = getattr(response, 'headers', {}).get('Retry-After')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+    backoff = min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return backoff + random.uniform(0, 0.1)
 
 def safe_graphql_query(manager, query: str, variables: Dict = None, error_message: str = "Query failed") -> Dict:
     """
-    Safely execute a GraphQL query with error handling
-    
+    Safely execute a GraphQL query with retries on transient failures
+
     Args:
         manager: MonitorManager instance
         query: GraphQL query string
         variables: Optional variables dictionary
         error_message: Custom error message
-        
+
     Returns:
-        Query result or empty dictionary
+        Query result as a plain dictionary
+
+    Raises:
+        GraphQLQueryError: If the query is non-retryable or still failing
+            after all attempts; the original exception is attached
     """
-    try:
-        # Log the query for debugging
-        LOGGER.info(f"Executing query: {query}")
-        if variables:
-            LOGGER.info(f"Variables: {json.dumps(variables, indent=2)}")
-        
-        # Execute the query
-        result = manager.mc_client.execute_query(query, variables or {})
-        
-        # Log the result for debugging
-        if hasattr(result, "_data"):
-            result_dict = result._data
-        else:
-            result_dict = result
-            
-        # Convert to regular dict for logging
-        if hasattr(result_dict, "__dict__"):
-            result_dict = result_dict.__dict__
-        
-        LOGGER.info(f"Query result: {json.dumps(result_dict, indent=2)}")
-        
-        return result
-    except Exception as e:
-        LOGGER.error(f"{error_message}: {str(e)}")
-        return {}
\ No newline at end of file
+    last_error = None
+
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            # Log the query for debugging; %s/%r arguments are only
+            # formatted when a DEBUG handler actually emits the record
+            LOGGER.debug("Executing query: %s", query)
+            if variables:
+                LOGGER.debug("Variables: %r", variables)
+
+            # Execute the query (results are plain dictionaries)
+            result = manager.mc_client.execute_query(query, variables or {})
+
+            LOGGER.debug("Query result: %r", result)
+
+            return result
+        except Exception as e:
+            last_error = e
+            if not _is_retryable(e) or attempt + 1 >= MAX_ATTEMPTS:
+                break
+
+            delay = _retry_delay(attempt, e)
+            LOGGER.warning(f"{error_message} (attempt {attempt + 1} of {MAX_ATTEMPTS}), "
+                           f"retrying in {delay:.1f}s: {str(e)}")
+            time.sleep(delay)
+
+    LOGGER.error(f"{error_message}: {str(last_error)}")
+    raise GraphQLQueryError(error_message, original=last_error)